@@ -9,6 +9,7 @@ from src.services import (
 )
 
 from src.api.schemas import ResumeSelections
+from langchain_core.caches import InMemoryCache
 from langchain_core.messages import BaseMessage, HumanMessage
 from langgraph.types import Command
 from langgraph.checkpoint.memory import InMemorySaver
@@ -33,6 +34,10 @@ REQUIRED_SETTINGS = [
 ]
 
 DEFAULT_RECURSION_LIMIT = int(os.getenv("GRAPH_RECURSION_LIMIT", "100"))
+# Exact-prompt LLM response cache size; 0 disables caching.
+LLM_CACHE_MAXSIZE = int(os.getenv("LLM_CACHE_MAXSIZE", "256"))
+# Client-side retries (exponential backoff) on rate limits and transient errors.
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "5"))
 
 def _ensure_configuration(settings: ApiSettings) -> None:
     missing = [field for field in REQUIRED_SETTINGS if not getattr(settings, field)]
@@ -84,7 +89,9 @@ class WorkflowBundle:
         self.llm = ChatXAI(
             model="grok-4-fast-reasoning",
             temperature=0,
+            max_retries=LLM_MAX_RETRIES,
             api_key=settings.ensure("xai_api_key"),
+            cache=InMemoryCache(maxsize=LLM_CACHE_MAXSIZE) if LLM_CACHE_MAXSIZE > 0 else None,
         )
 
         self.retrieval_pipeline = self._build_retrieval_pipeline()
@@ -108,11 +115,14 @@ class WorkflowBundle:
         )
 
         review_mode = os.getenv("HUMAN_REVIEW_MODE", "auto")
+        # One checkpointer serves every thread; cleanup_thread() drops a
+        # thread's checkpoints so the store does not grow without bound.
+        self.memory = InMemorySaver()
         self.graph = build_research_graph(
             llm=self.llm,
             agents=self.agents,
             human_review=review_mode,
-            memory=InMemorySaver(),
+            memory=self.memory,
         )
 
         self._contexts: Dict[str, Context] = {}
@@ -166,6 +176,19 @@ class WorkflowBundle:
         
         return f"Cleaned up {len(old_threads)} threads"
 
+    def cleanup_thread(self, thread_id: str) -> None:
+        """Forget a planning thread and delete its checkpoints.
+
+        Args:
+            thread_id: Unique identifier for the planning thread
+        """
+        self._contexts.pop(thread_id, None)
+        self._configs.pop(thread_id, None)
+        self._pending_states.pop(thread_id, None)
+        self._pending_interrupts.pop(thread_id, None)
+        self._thread_timestamps.pop(thread_id, None)
+        self.memory.delete_thread(thread_id)
+
     def _build_retrieval_pipeline(self) -> RetrievalPipeline:
         """Build the RAG pipeline for document retrieval and reranking.
         
@@ -238,6 +261,7 @@ class WorkflowBundle:
 
         self._contexts[active_thread] = context
         self._configs[active_thread] = config
+        self._thread_timestamps[active_thread] = datetime.now()
         self._pending_states.pop(active_thread, None)
         self._pending_interrupts.pop(active_thread, None)
 
@@ -1,3 +1,4 @@
+import functools
 from langgraph.graph import StateGraph, START, END
 from langgraph.checkpoint.memory import InMemorySaver
 from langchain_core.language_models.chat_models import BaseChatModel
@@ -11,6 +12,41 @@ from src.core.schemas import ResearchAgents, LodgingAgentOutput, ActivitiesAgent
 from langgraph.prebuilt import create_react_agent
 from src.core.post_processing import create_pydantic_hook
 
+
+_RESEARCH_NODES = (
+    "research_activities",
+    "research_lodging",
+    "research_food",
+    "research_intercity_transport",
+    "research_recommendations",
+)
+
+# Static topology: START -> budget -> plan -> parallel research -> review.
+# combined_human_review routes conditionally (to planner or back to research).
+_GRAPH_EDGES = (
+    (START, "budget_estimate"),
+    ("budget_estimate", "research_plan"),
+    *(("research_plan", node) for node in _RESEARCH_NODES),
+    *((node, "combined_human_review") for node in _RESEARCH_NODES),
+    ("planner", END),
+)
+
+
+class _IdentityKey:
+    """Hashable wrapper comparing by object identity, for unhashable graph inputs."""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Any) -> None:
+        self.obj = obj
+
+    def __hash__(self) -> int:
+        return id(self.obj)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _IdentityKey) and other.obj is self.obj
+
+
 def build_research_graph(
     *,
     llm: BaseChatModel,
@@ -18,53 +54,54 @@ def build_research_graph(
     human_review: str = "auto",
     memory: Optional[InMemorySaver] = None,
 ) -> Any:
-    """Wire all nodes into a compiled LangGraph state machine."""
-
-    # Create all the nodes
-    budget_estimate_node = make_budget_estimate_node(llm)
-    research_plan_node = make_research_plan_node(llm)
-    lodging_node = make_lodging_node(agents.lodging)
-    activities_node = make_activities_node(agents.activities)
-    food_node = make_food_node(agents.food)
-    intercity_node = make_intercity_transport_node(agents.intercity_transport)
-    recommendations_node = make_recommendations_node(agents.recommendations)
-    human_review_node = make_combined_human_review_node()
-    planner_node = make_planner_node(llm)
+    """Wire all nodes into a compiled LangGraph state machine.
+
+    Compiled graphs are cached per ``(llm, agents, human_review, memory)``
+    identity, so repeated calls with the same components reuse one graph
+    (and, when ``memory`` is omitted, one shared checkpointer; threads stay
+    isolated by their ``thread_id``).
+    """
+
+    return _compile_research_graph(
+        _IdentityKey(llm),
+        _IdentityKey(agents),
+        human_review,
+        _IdentityKey(memory) if memory is not None else None,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_research_graph(
+    llm_key: _IdentityKey,
+    agents_key: _IdentityKey,
+    human_review: str,
+    memory_key: Optional[_IdentityKey],
+) -> Any:
+    llm = llm_key.obj
+    agents = agents_key.obj
+    memory = memory_key.obj if memory_key is not None else None
+
+    nodes = {
+        "budget_estimate": make_budget_estimate_node(llm),
+        "research_plan": make_research_plan_node(llm),
+        "research_lodging": make_lodging_node(agents.lodging),
+        "research_activities": make_activities_node(agents.activities),
+        "research_food": make_food_node(agents.food),
+        "research_intercity_transport": make_intercity_transport_node(agents.intercity_transport),
+        "research_recommendations": make_recommendations_node(agents.recommendations),
+        "combined_human_review": make_combined_human_review_node(),
+        "planner": make_planner_node(llm),
+    }
 
     graph_builder = StateGraph(state_schema=State, context_schema=Context)
 
-    graph_builder.add_node("budget_estimate", budget_estimate_node)
-    graph_builder.add_node("research_plan", research_plan_node)
-    graph_builder.add_node("research_lodging", lodging_node)
-    graph_builder.add_node("research_activities", activities_node)
-    graph_builder.add_node("research_food", food_node)
-    graph_builder.add_node("research_intercity_transport", intercity_node)
-    graph_builder.add_node("research_recommendations", recommendations_node)
-    graph_builder.add_node("combined_human_review", human_review_node)
-    graph_builder.add_node("planner", planner_node)
-
-    # Initial flow
-    graph_builder.add_edge(START, "budget_estimate")
-    graph_builder.add_edge("budget_estimate", "research_plan")
-
-    # Parallel research
-    graph_builder.add_edge("research_plan", "research_activities")
-    graph_builder.add_edge("research_plan", "research_lodging")
-    graph_builder.add_edge("research_plan", "research_food")
-    graph_builder.add_edge("research_plan", "research_intercity_transport")
-    graph_builder.add_edge("research_plan", "research_recommendations")
-
-    graph_builder.add_edge("research_activities", "combined_human_review")
-    graph_builder.add_edge("research_lodging", "combined_human_review")
-    graph_builder.add_edge("research_food", "combined_human_review")
-    graph_builder.add_edge("research_intercity_transport", "combined_human_review")
-    graph_builder.add_edge("research_recommendations", "combined_human_review")
+    for name, node in nodes.items():
+        graph_builder.add_node(name, node)
+    for source, target in _GRAPH_EDGES:
+        graph_builder.add_edge(source, target)
 
     graph_builder.add_conditional_edges("combined_human_review", path=route_from_human_response)
 
-    # Then from combined_human_review to planner
-    graph_builder.add_edge("planner", END)
-
     return graph_builder.compile(checkpointer=memory or InMemorySaver())
 
 
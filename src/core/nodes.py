@@ -1,8 +1,11 @@
 """LangGraph workflow assembly extracted from the notebook."""
 from __future__ import annotations
 
+import functools
 import json
-from typing import Any, Dict, List, Union
+import os
+import weakref
+from typing import Any, Awaitable, Callable, Dict, List, Union
 
 from langchain.agents import AgentExecutor
 from langchain_core.language_models.chat_models import BaseChatModel
@@ -19,6 +22,7 @@ from src.core.prompts import (
     final_plan_prompt,
 )
 from src.core.schemas import (
+    CANDIDATE_LIST_ADAPTERS,
     ActivitiesAgentOutput,
     BudgetEstimate,
     CandidateIntercityTransport,
@@ -34,103 +38,131 @@ from src.core.schemas import (
     CandidateActivity,
     CandidateFood,
     CandidateResearch,
-    Traveller,
+    fast_wrap,
 )
 from src.services.geocoding import get_coordinates_nominatim
 import logging
 import asyncio
 from src.core.post_processing import create_pydantic_hook
+from src.core.reducer import Replace
 from langgraph.types import interrupt
 
 logger = logging.getLogger(__name__)
 
-def make_traveller_context(travellers: List[Traveller]) -> str:
-    """Make the traveller context for the prompt."""
-    traveller_context = ""
-    if travellers:
-        for traveller in travellers:
-            context_parts = [traveller.name, f"age: {traveller.age_group}"]
-            
-            if traveller.interests:
-                context_parts.append(f"interests: {', '.join(traveller.interests)}")
-            if traveller.nationality:
-                context_parts.append(f"nationality: {traveller.nationality}")
-            if traveller.spoken_languages:
-                context_parts.append(f"languages: {', '.join(traveller.spoken_languages)}")
-                
-            traveller_context += f"- {' | '.join(context_parts)}\n"
-    return traveller_context
+# Caps in-flight model calls (structured LLM calls and agent runs) across all
+# concurrently executing nodes and planning threads on one event loop.
+_LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "6"))
+_LLM_SEMAPHORES: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _llm_semaphore() -> asyncio.Semaphore:
+    """Return the running loop's semaphore, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    semaphore = _LLM_SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = _LLM_SEMAPHORES[loop] = asyncio.Semaphore(_LLM_MAX_CONCURRENCY)
+    return semaphore
+
+
+async def _limited(call: Callable[[], Awaitable[Any]]) -> Any:
+    """Start a model call only once a shared concurrency slot is free."""
+    async with _llm_semaphore():
+        return await call()
+
 
 def _extract_agent_output(
     response: Dict[str, Any],
     *,
     key: str,
-    default,
+    default_factory: Callable[[], Any],
 ) -> Dict[str, Any]:
     """Normalise agent responses into the shared node contract."""
 
-    logger.debug(f"Agent response: {response}")
+    logger.debug("Agent response: %s", response)
 
-    payload = response.get("structured_response", default)
-    messages = response.get("messages", [AIMessage(content="Empty response")])
+    payload = response["structured_response"] if "structured_response" in response else default_factory()
+    messages = response.get("messages")
+    if messages is None:
+        # Built per call: add_messages assigns ids in place, so it can't be shared
+        messages = [AIMessage(content="Empty response")]
 
-    logger.info(f"Agent output: {payload}")
-    logger.debug(f"Agent output type: {type(payload)}")
+    logger.info("Agent output: %s", payload)
+    logger.debug("Agent output type: %s", type(payload))
 
     return {"messages": messages, key: payload}
 
-async def make_research(prompt: str, agent: AgentExecutor, name: str, default: Any):
+def _validate_selection(kind: str, data: Any) -> List[Any]:
+    """Validate a resumed human selection (single dict or list) in one adapter call."""
+    if not isinstance(data, list):
+        data = [data]
+    return CANDIDATE_LIST_ADAPTERS[kind].validate_python(data)
+
+def _content_to_text(content: Any) -> str | None:
+    """Flatten AIMessage content into the raw text the post-model hook parses."""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        text_chunks: List[str] = []
+        for chunk in content:
+            if isinstance(chunk, str):
+                text_chunks.append(chunk)
+            elif isinstance(chunk, dict) and chunk.get("type") == "text":
+                text_chunks.append(chunk.get("text", ""))
+            else:
+                break
+        else:
+            # Common case: only text blocks, so skip the json.dumps round trip
+            if text_chunks:
+                return "\n".join(text_chunks)
+        try:
+            return json.dumps(content)
+        except (TypeError, ValueError):
+            text_chunks = [
+                chunk if isinstance(chunk, str) else chunk.get("text", "")
+                for chunk in content
+                if isinstance(chunk, str) or (isinstance(chunk, dict) and chunk.get("type") == "text")
+            ]
+            return "\n".join(text_chunks) if text_chunks else None
+    if isinstance(content, dict):
+        try:
+            return json.dumps(content)
+        except (TypeError, ValueError):
+            return str(content)
+    return None if content is None else str(content)
+
+
+async def make_research(prompt: str, agent: AgentExecutor, name: str, default_factory: Callable[[], Any]):
     """Generic research function for all agent types."""
     
     try:
         agent_input = {'messages': [HumanMessage(content=prompt.strip(), name=name)]}
-        logger.debug(f"{name} agent input: {agent_input}")
+        logger.debug("%s agent input: %s", name, agent_input)
         
-        response = await agent.ainvoke(agent_input)
+        response = await _limited(functools.partial(agent.ainvoke, agent_input))
 
         raw_output: str | None = None
-        response_messages = response.get("messages", []) if isinstance(response, dict) else []
+        # Read once: scanned for the final AI message and passed on unchanged
+        response_messages = response.get("messages") if isinstance(response, dict) else None
 
         if isinstance(response_messages, list):
             for message in reversed(response_messages):
                 if isinstance(message, AIMessage):
-                    content = message.content
-                    if isinstance(content, str):
-                        raw_output = content
-                    elif isinstance(content, dict):
-                        try:
-                            raw_output = json.dumps(content)
-                        except (TypeError, ValueError):
-                            raw_output = str(content)
-                    elif isinstance(content, list):
-                        serialised: str | None = None
-                        try:
-                            serialised = json.dumps(content)
-                        except (TypeError, ValueError):
-                            text_chunks: List[str] = []
-                            for chunk in content:
-                                if isinstance(chunk, dict) and chunk.get("type") == "text":
-                                    text_chunks.append(chunk.get("text", ""))
-                                elif isinstance(chunk, str):
-                                    text_chunks.append(chunk)
-                            if text_chunks:
-                                serialised = "\n".join(text_chunks)
-                        raw_output = serialised
-                    elif content is not None:
-                        raw_output = str(content)
+                    raw_output = _content_to_text(message.content)
                     break
 
         hook = create_pydantic_hook(name)
         processed_response = hook.convert(response, raw_output=raw_output)
-        output = {"messages": response.get("messages", [AIMessage(content="Empty response")]), "structured_response": processed_response}
-        logger.debug(f"{name} agent response: {output}")
-        return _extract_agent_output(output, key=name, default=default)
+        output = {"messages": response_messages, "structured_response": processed_response}
+        logger.debug("%s agent response: %s", name, output)
+        return _extract_agent_output(output, key=name, default_factory=default_factory)
         
     except Exception as e:
-        logger.error(f"Error invoking {name} agent: {e}")
+        logger.error("Error invoking %s agent: %s", name, e)
 
-        logger.warning(f"Returning default for {name} due to error")
-        return {"messages": [AIMessage(content=f"Error: {e}")], name: default}
+        logger.warning("Returning default for %s due to error", name)
+        return {"messages": [AIMessage(content=f"Error: {e}")], name: default_factory()}
 
 
 def make_budget_estimate_node(llm: BaseChatModel):
@@ -140,26 +172,15 @@ def make_budget_estimate_node(llm: BaseChatModel):
 
 
     async def node(state: State, runtime: Runtime[Context]) -> Dict[str, Any]:
-        traveller_context = make_traveller_context(runtime.context.travellers)
-
         prompt = budget_estimate_prompt.format(
-            destination=runtime.context.destination,
-            destination_country=runtime.context.destination_country,
-            date_from=runtime.context.date_from,
-            date_to=runtime.context.date_to,
-            days_number=runtime.context.days_number,
-            group_type=runtime.context.group_type,
+            **runtime.context.prompt_fields,
             budget=runtime.context.budget,
-            currency=runtime.context.currency,
-            trip_purpose=runtime.context.trip_purpose or 'General travel',
             current_location=runtime.context.current_location or 'Not specified',
-            traveller_context=traveller_context,
-            notes=f"ADDITIONAL CONTEXT: {runtime.context.notes}" if runtime.context.notes else ""
         )
         try:
-            budget = await structured_llm.ainvoke(prompt)
+            budget = await _limited(functools.partial(structured_llm.ainvoke, prompt))
         except Exception as e:
-            logger.error(f"Error invoking budget estimate node: {e}")
+            logger.error("Error invoking budget estimate node: %s", e)
             raise e
         
         return {
@@ -181,39 +202,27 @@ def make_research_plan_node(llm: BaseChatModel):
     structured_llm = llm.with_structured_output(ResearchPlan)
 
     async def node(state: State, runtime: Runtime[Context]) -> Dict[str, Any]:
-        traveller_context = make_traveller_context(runtime.context.travellers)
+        budget = state.estimated_budget
         prompt = research_plan_prompt.format(
-            destination=runtime.context.destination,
-            destination_country=runtime.context.destination_country,
-            date_from=runtime.context.date_from,
-            date_to=runtime.context.date_to,
-            days_number=runtime.context.days_number,
-            group_type=runtime.context.group_type,
-            adults_num=runtime.context.adults_num if runtime.context.adults_num else 0,
-            children_num=runtime.context.children_num if runtime.context.children_num else 0,
-            infant_num=runtime.context.infant_num if runtime.context.infant_num else 0,
-            trip_purpose=runtime.context.trip_purpose or 'General travel',
-            budget_level=state.estimated_budget.budget_level if state.estimated_budget else '$$',
-            total_budget=state.estimated_budget.total if state.estimated_budget else runtime.context.budget,
-            currency=runtime.context.currency,
-            intercity_transport=state.estimated_budget.intercity_transport if state.estimated_budget else 0,
-            local_transport=state.estimated_budget.local_transport if state.estimated_budget else 0,
-            food=state.estimated_budget.food if state.estimated_budget else 0,
-            activities=state.estimated_budget.activities if state.estimated_budget else 0,
-            lodging=state.estimated_budget.lodging if state.estimated_budget else 0,
-            other=state.estimated_budget.other if state.estimated_budget else 0,
-            traveller_context=traveller_context,    
-            additional_context=f"ADDITIONAL CONTEXT: {runtime.context.notes}" if runtime.context.notes else ""
+            **runtime.context.prompt_fields,
+            budget_level=budget.budget_level if budget else '$$',
+            total_budget=budget.total if budget else runtime.context.budget,
+            intercity_transport=budget.intercity_transport if budget else 0,
+            local_transport=budget.local_transport if budget else 0,
+            food=budget.food if budget else 0,
+            activities=budget.activities if budget else 0,
+            lodging=budget.lodging if budget else 0,
+            other=budget.other if budget else 0,
         )
         try:
             coordinates_task = get_coordinates_nominatim(
             f"{runtime.context.destination}, {runtime.context.destination_country}"
         )
-            plan_task = structured_llm.ainvoke(prompt)
+            plan_task = _limited(functools.partial(structured_llm.ainvoke, prompt))
 
             coordinates, plan = await asyncio.gather(coordinates_task, plan_task)
         except Exception as e:
-            logger.error(f"Error invoking research plan node: {e}")
+            logger.error("Error invoking research plan node: %s", e)
             raise e
         
         
@@ -231,35 +240,38 @@ def make_research_plan_node(llm: BaseChatModel):
     return node
 
 
+# Fallback outputs for failed research runs, built per call so that no two
+# state updates share one mutable model instance.
+def _empty_lodging() -> LodgingAgentOutput:
+    return LodgingAgentOutput(lodging=[])
+
+
+def _empty_activities() -> ActivitiesAgentOutput:
+    return ActivitiesAgentOutput(activities=[])
+
+
+def _empty_food() -> FoodAgentOutput:
+    return FoodAgentOutput(food=[])
+
+
+def _empty_intercity_transport() -> IntercityTransportAgentOutput:
+    return IntercityTransportAgentOutput(intercity_transport=[])
+
+
 def make_lodging_node(agent: AgentExecutor):
     """Return an async node that orchestrates lodging research."""
 
     async def node(state: State, runtime: Runtime[Context]) -> Dict[str, Any]:
         candidates = state.research_plan.lodging_candidates if state.research_plan else None
-        traveller_context = make_traveller_context(runtime.context.travellers)
-
         prompt = lodging_research_prompt.format(
-            destination=runtime.context.destination,
-            destination_country=runtime.context.destination_country,
-            date_from=runtime.context.date_from,
-            date_to=runtime.context.date_to,
-            days_number=runtime.context.days_number,
-            group_type=runtime.context.group_type,
-            adults_num=runtime.context.adults_num if runtime.context.adults_num else 0,
-            children_num=runtime.context.children_num if runtime.context.children_num else 0,
-            infant_num=runtime.context.infant_num if runtime.context.infant_num else 0,
-            trip_purpose=runtime.context.trip_purpose or 'General travel',
+            **runtime.context.prompt_fields,
             lodging_budget=state.estimated_budget.lodging if state.estimated_budget else runtime.context.budget * 0.3,
-            currency=runtime.context.currency,
-            traveller_context=traveller_context,
             candidates_number=candidates.candidates_number if candidates and candidates.candidates_number else 4,
             research_name=candidates.name if candidates and candidates.name else "Lodging Research",
             research_description=candidates.description if candidates and candidates.description else "Find suitable accommodations",
-            additional_context=f"ADDITIONAL CONTEXT: {runtime.context.notes}" if runtime.context.notes else ""
         )
 
-        default = LodgingAgentOutput(lodging=[])
-        return await make_research(prompt, agent, "lodging", default)
+        return await make_research(prompt, agent, "lodging", _empty_lodging)
 
     return node
 
@@ -268,31 +280,17 @@ def make_activities_node(agent: AgentExecutor):
     """Create the activities research node used in the LangGraph flow."""
 
     async def node(state: State, runtime: Runtime[Context]) -> Dict[str, Any]:
-        traveller_context = make_traveller_context(runtime.context.travellers)
         candidates = state.research_plan.activities_candidates if state.research_plan else None
         prompt = activities_research_prompt.format(
-            destination=runtime.context.destination,
-            destination_country=runtime.context.destination_country,
-            date_from=runtime.context.date_from,
-            date_to=runtime.context.date_to,
-            days_number=runtime.context.days_number,
-            group_type=runtime.context.group_type,
-            adults_num=runtime.context.adults_num if runtime.context.adults_num else 0,
-            children_num=runtime.context.children_num if runtime.context.children_num else 0,
-            infant_num=runtime.context.infant_num if runtime.context.infant_num else 0,
-            trip_purpose=runtime.context.trip_purpose or 'General travel',
+            **runtime.context.prompt_fields,
             activities_budget=state.estimated_budget.activities if state.estimated_budget else runtime.context.budget * 0.2,
-            currency=runtime.context.currency,
-            traveller_context=traveller_context,
             candidates_number=candidates.candidates_number if candidates and candidates.candidates_number else 5,
             research_name=candidates.name if candidates and candidates.name else "Activities Research",
             research_description=candidates.description if candidates and candidates.description else "Find engaging activities and attractions",
-            additional_context=f"ADDITIONAL CONTEXT: {runtime.context.notes}" if runtime.context.notes else ""
         )
 
     
-        default = ActivitiesAgentOutput(activities=[])
-        return await make_research(prompt, agent, "activities", default)
+        return await make_research(prompt, agent, "activities", _empty_activities)
 
     return node
 
@@ -302,29 +300,14 @@ def make_food_node(agent: AgentExecutor):
 
     async def node(state: State, runtime: Runtime[Context]) -> Dict[str, Any]:
         candidates = state.research_plan.food_candidates if state.research_plan else None
-        traveller_context = make_traveller_context(runtime.context.travellers)
-
         prompt = food_research_prompt.format(
-            destination=runtime.context.destination,
-            destination_country=runtime.context.destination_country,
-            date_from=runtime.context.date_from,
-            date_to=runtime.context.date_to,
-            days_number=runtime.context.days_number,
-            group_type=runtime.context.group_type,
-            adults_num=runtime.context.adults_num if runtime.context.adults_num else 0,
-            children_num=runtime.context.children_num if runtime.context.children_num else 0,
-            infant_num=runtime.context.infant_num if runtime.context.infant_num else 0,
-            trip_purpose=runtime.context.trip_purpose or 'General travel',
+            **runtime.context.prompt_fields,
             food_budget=state.estimated_budget.food if state.estimated_budget else runtime.context.budget * 0.3,
-            currency=runtime.context.currency,
-            traveller_context=traveller_context,
             candidates_number=candidates.candidates_number if candidates and candidates.candidates_number else 4,
             research_name=candidates.name if candidates and candidates.name else "Food Research",
             research_description=candidates.description if candidates and candidates.description else "Find suitable food",
-            additional_context=f"ADDITIONAL CONTEXT: {runtime.context.notes}" if runtime.context.notes else ""
         )
-        default = FoodAgentOutput(food=[])
-        return await make_research(prompt, agent, "food", default)
+        return await make_research(prompt, agent, "food", _empty_food)
 
     return node
 
@@ -334,31 +317,16 @@ def make_intercity_transport_node(agent: AgentExecutor):
 
     async def node(state: State, runtime: Runtime[Context]) -> Dict[str, Any]:
         candidates = state.research_plan.intercity_transport_candidates if state.research_plan else None
-        traveller_context = make_traveller_context(runtime.context.travellers)
-
         prompt = intercity_transport_research_prompt.format(
+            **runtime.context.prompt_fields,
             current_location=runtime.context.current_location or 'Origin not specified',
-            destination=runtime.context.destination,
-            destination_country=runtime.context.destination_country,
-            date_from=runtime.context.date_from,
-            date_to=runtime.context.date_to,
-            days_number=runtime.context.days_number,
-            group_type=runtime.context.group_type,
-            adults_num=runtime.context.adults_num if runtime.context.adults_num else 0,
-            children_num=runtime.context.children_num if runtime.context.children_num else 0,
-            infant_num=runtime.context.infant_num if runtime.context.infant_num else 0,
-            trip_purpose=runtime.context.trip_purpose or 'General travel',
             intercity_budget=state.estimated_budget.intercity_transport if state.estimated_budget else runtime.context.budget * 0.4,
-            currency=runtime.context.currency,
-            traveller_context=traveller_context,
             candidates_number=candidates.candidates_number if candidates and candidates.candidates_number else 3,
             research_name=candidates.name if candidates and candidates.name else "Intercity Transport Research",
             research_description=candidates.description if candidates and candidates.description else "Find transportation options between cities",
-            additional_context=f"ADDITIONAL CONTEXT: {runtime.context.notes}" if runtime.context.notes else ""
         )
        
-        default = IntercityTransportAgentOutput(intercity_transport=[])
-        return await make_research(prompt, agent, "intercity_transport", default)
+        return await make_research(prompt, agent, "intercity_transport", _empty_intercity_transport)
 
     return node
 
@@ -367,25 +335,12 @@ def make_recommendations_node(agent: AgentExecutor):
     """Build the advisory node that aggregates safety and culture notes."""
 
     async def node(state: State, runtime: Runtime[Context]) -> Dict[str, Any]:
-        traveller_context = make_traveller_context(runtime.context.travellers)
         prompt = recommendations_research_prompt.format(
-            destination=runtime.context.destination,
-            destination_country=runtime.context.destination_country,
-            date_from=runtime.context.date_from,
-            date_to=runtime.context.date_to,
-            days_number=runtime.context.days_number,
-            group_type=runtime.context.group_type,
-            adults_num=runtime.context.adults_num if runtime.context.adults_num else 0,
-            children_num=runtime.context.children_num if runtime.context.children_num else 0,
-            infant_num=runtime.context.infant_num if runtime.context.infant_num else 0,
-            trip_purpose=runtime.context.trip_purpose or 'General travel',
-            traveller_context=traveller_context,
+            **runtime.context.prompt_fields,
             research_name="Travel Recommendations and Cultural Advice",
             research_description="Provide comprehensive travel recommendations covering safety, culture, and practical information",
-            additional_context=f"ADDITIONAL CONTEXT: {runtime.context.notes}" if runtime.context.notes else ""
         )
-        default = RecommendationsOutput()
-        return await make_research(prompt, agent, "recommendations", default)
+        return await make_research(prompt, agent, "recommendations", RecommendationsOutput)
 
     return node
 
@@ -396,35 +351,23 @@ def make_planner_node(llm: BaseChatModel):
     structured_llm = llm.with_structured_output(FinalPlan)
 
     async def node(state: State, runtime: Runtime[Context]) -> Dict[str, Any]:
-        traveller_context = make_traveller_context(runtime.context.travellers)
         # Define the prompt
         research_result = "AVAILABLE RESEARCH RESULTS:\n\n"
                 
+        # exclude_none keeps unset candidate fields out of the prompt tokens
         if state.activities and state.activities.activities:
-            research_result+= state.activities.model_dump_json()
+            research_result+= state.activities.model_dump_json(exclude_none=True)
         
         if state.food and state.food.food:
-            research_result+= state.food.model_dump_json()
+            research_result+= state.food.model_dump_json(exclude_none=True)
 
         prompt = final_plan_prompt.format(
-            destination=runtime.context.destination,
-            destination_country=runtime.context.destination_country,
-            date_from=runtime.context.date_from,
-            date_to=runtime.context.date_to,
-            days_number=runtime.context.days_number,
-            group_type=runtime.context.group_type,
-            adults_num=runtime.context.adults_num if runtime.context.adults_num else 0,
-            children_num=runtime.context.children_num if runtime.context.children_num else 0,
-            infant_num=runtime.context.infant_num if runtime.context.infant_num else 0,
-            trip_purpose=runtime.context.trip_purpose or 'General travel',
+            **runtime.context.prompt_fields,
             total_budget=state.estimated_budget.total if state.estimated_budget else runtime.context.budget,
-            currency=runtime.context.currency,
-            traveller_context=traveller_context,
             research_results_summary=research_result,
-            additional_context=f"ADDITIONAL CONTEXT: {runtime.context.notes}" if runtime.context.notes else ""
         )
         try:
-            planner = await structured_llm.ainvoke(prompt)
+            planner = await _limited(functools.partial(structured_llm.ainvoke, prompt))
 
             if state.lodging and state.lodging.lodging:
                 planner.lodging = state.lodging.lodging
@@ -436,15 +379,15 @@ def make_planner_node(llm: BaseChatModel):
                 planner.recommendations = state.recommendations
 
             planner.currency = runtime.context.currency
-            logger.debug(f"Final plan: {planner}")
+            logger.debug("Planner prompt: %s", prompt)
+            logger.debug("Final plan: %s", planner)
         except Exception as e:
-            logger.error(f"Error invoking planner: {e}")
+            logger.error("Error invoking planner: %s", e)
             raise e
         
 
         return {
             "messages": [
-                HumanMessage(content=f"Prompt: {prompt}", name="planner_prompt"),
                 AIMessage(content=f"Final plan: {planner}", name="final_plan")
             ],
             "final_plan": planner,
@@ -453,6 +396,29 @@ def make_planner_node(llm: BaseChatModel):
     return node
 
 
+# Upper bound on options per review section; candidates keep the agent's order.
+MAX_REVIEW_OPTIONS = int(os.getenv("MAX_REVIEW_OPTIONS", "20"))
+
+# Interrupt sections in presentation order; each kind is both the State field
+# and the list attribute on its agent output.
+_REVIEW_TASKS = (
+    ("lodging", "Choose lodging option", LodgingAgentOutput),
+    ("intercity_transport", "Choose intercity_transport option", IntercityTransportAgentOutput),
+    ("activities", "Choose activity option", ActivitiesAgentOutput),
+    ("food", "Choose food option", FoodAgentOutput),
+)
+
+
+def _is_unchanged_selection(selection: Any, items: Any, options: List[Dict[str, Any]]) -> bool:
+    """True when the resumed selection is exactly the offered list, as models or JSON dumps."""
+    if not items or not isinstance(selection, list) or len(selection) != len(items):
+        return False
+    return all(
+        chosen == item or chosen == option
+        for chosen, item, option in zip(selection, items, options)
+    )
+
+
 def make_combined_human_review_node():
     """Return a node that pauses execution to collect human selections."""
 
@@ -460,34 +426,23 @@ def make_combined_human_review_node():
         """Single node that handles both lodging and transport selection"""
         
         interrupts_needed = []
+        offered: Dict[str, Any] = {}
 
-        if state.lodging and state.lodging.lodging:
-            interrupts_needed.append({
-                "type": "lodging",
-                "task": "Choose lodging option",
-                "options": [lodging.model_dump() for lodging in state.lodging.lodging]
-            })
-
-        if state.intercity_transport and state.intercity_transport.intercity_transport:
-            interrupts_needed.append({
-                "type": "intercity_transport",
-                "task": "Choose intercity_transport option",
-                "options": [transport.model_dump() for transport in state.intercity_transport.intercity_transport]
-            })
-
-        if state.activities and state.activities.activities:
-            interrupts_needed.append({
-                "type": "activities",
-                "task": "Choose activity option",
-                "options": [activity.model_dump() for activity in state.activities.activities]
-            })
+        for kind, task, _ in _REVIEW_TASKS:
+            output = getattr(state, kind)
+            items = getattr(output, kind)[:MAX_REVIEW_OPTIONS] if output else None
+            if items:
+                # JSON mode so selections resumed over the API (lists, not
+                # tuples) still compare equal to what was offered.
+                options = CANDIDATE_LIST_ADAPTERS[kind].dump_python(items, mode="json")
+                offered[kind] = (items, options)
+                interrupts_needed.append({
+                    "type": kind,
+                    "task": task,
+                    "options": options,
+                })
 
-        if state.food and state.food.food:
-            interrupts_needed.append({
-                "type": "food",
-                "task": "Choose food option",
-                "options": [food.model_dump() for food in state.food.food]
-            })
+        research_plan_dump = state.research_plan.model_dump() if state.research_plan else None
 
 
         # Import interrupt RIGHT BEFORE using it to avoid namespace conflicts
@@ -499,7 +454,7 @@ def make_combined_human_review_node():
         result = interrupt({
             "task": "Make your selections for the following options",
             "selections": interrupts_needed,
-            "research_plan": state.research_plan.model_dump() if state.research_plan else None
+            "research_plan": research_plan_dump
         })
 
         # This code runs AFTER resume
@@ -511,67 +466,62 @@ def make_combined_human_review_node():
         if "research_plan" in result and result["research_plan"]:
             
             research_plan_dict = result["research_plan"]
-            research_plan_data = {}
-
-            # Convert each category to CandidateResearch objects
-            for category_key, category_data in research_plan_dict.items():
-                if category_data:
-                    research_plan_data[category_key] = CandidateResearch(**category_data)
-
-            # Create ResearchPlan and convert to dict for state update
-            research_plan = ResearchPlan(**research_plan_data)
-            response["research_plan"] = research_plan.model_dump()
+            if research_plan_dict == research_plan_dump:
+                # Unchanged plan: the validated model is already in state
+                response["research_plan"] = state.research_plan
+            else:
+                research_plan_data = {}
+
+                # Convert each category to CandidateResearch objects
+                for category_key, category_data in research_plan_dict.items():
+                    if category_data:
+                        research_plan_data[category_key] = CandidateResearch(**category_data)
+
+                # Hand the model itself to the state update; a dict would be
+                # dumped here only to be validated back into a ResearchPlan
+                response["research_plan"] = ResearchPlan(**research_plan_data)
         else:
             response["research_plan"] = None
 
-        # Handle activities - could be single dict or list of dicts
-        if "activities" in result and result["activities"]:
-            activities_data = result["activities"]
-            
-            response["activities"] = ActivitiesAgentOutput(activities=activities_data)
-
-        # Handle food - could be single dict or list of dicts
-        if "food" in result and result["food"]:
-            food_data = result["food"]
-
-            response["food"] = FoodAgentOutput(food=food_data)
-
-        # Handle lodging - expecting single dict but wrap in list for LodgingAgentOutput
-        if "lodging" in result and result["lodging"]:
-            lodging_data = result["lodging"]
-           
-            response["lodging"] = LodgingAgentOutput(lodging=lodging_data)
-
-        # Handle intercity_transport - expecting single dict but wrap in list for IntercityTransportAgentOutput
-        if "intercity_transport" in result and result["intercity_transport"]:
-            transport_data = result["intercity_transport"]
-        
-            response["intercity_transport"] = IntercityTransportAgentOutput(intercity_transport=transport_data)
+        # Selections may be a single dict or a list; an unchanged list is
+        # already validated in state, so it needs no update at all (the
+        # reducer would otherwise merge state with itself).
+        for kind, _, output_cls in _REVIEW_TASKS:
+            selection = result.get(kind)
+            if not selection:
+                continue
+            if kind in offered and _is_unchanged_selection(selection, *offered[kind]):
+                output, items = getattr(state, kind), offered[kind][0]
+                # Options past MAX_REVIEW_OPTIONS were never shown, so drop
+                # them from state; rebuild only when some were cut.
+                if len(getattr(output, kind)) != len(items):
+                    response[kind] = Replace(fast_wrap(output_cls, **{kind: items}))
+                continue
+            # Replace rather than merge: the reducer would keep every
+            # unselected option alongside the selection.
+            response[kind] = Replace(
+                fast_wrap(output_cls, **{kind: _validate_selection(kind, selection)})
+            )
 
         return response
 
     return node
 
 
+# Research plan field -> research node, in dispatch order.
+_RESEARCH_ROUTES = (
+    ("activities_candidates", "research_activities"),
+    ("food_candidates", "research_food"),
+    ("lodging_candidates", "research_lodging"),
+    ("intercity_transport_candidates", "research_intercity_transport"),
+)
+
+
 def route_from_human_response(state: State, runtime: Runtime[Context]) -> Union[str, List[str]]:
     """Returns a list of nodes to execute in parallel based on conditions"""
-    nodes_to_execute = []
-    if not state.research_plan:
-        return "planner"
-
     research_plan = state.research_plan
+    if not research_plan:
+        return "planner"
 
-    # Direct attribute access (works if these are Optional[bool] fields)
-    if research_plan.activities_candidates:
-        nodes_to_execute.append("research_activities")
-
-    if research_plan.food_candidates:
-        nodes_to_execute.append("research_food")
-
-    if research_plan.lodging_candidates:
-        nodes_to_execute.append("research_lodging")
-
-    if research_plan.intercity_transport_candidates:
-        nodes_to_execute.append("research_intercity_transport")
-
-    return nodes_to_execute if nodes_to_execute else "planner"
+    nodes_to_execute = [node for field, node in _RESEARCH_ROUTES if getattr(research_plan, field)]
+    return nodes_to_execute or "planner"
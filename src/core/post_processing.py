@@ -1,12 +1,12 @@
-import json
 import logging
-import re
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, TypeVar, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Type, TypeVar, Union
 
 from langchain_core.callbacks import BaseCallbackHandler
 from pydantic import BaseModel, ValidationError
+from pydantic_core import from_json
 
 from src.core.schemas import (
+    CANDIDATE_LIST_ADAPTERS,
     ActivitiesAgentOutput,
     CandidateActivity,
     CandidateFood,
@@ -17,23 +17,53 @@ from src.core.schemas import (
     LodgingAgentOutput,
     RecommendationsOutput,
     Transfer,
+    fast_wrap,
 )
 
 logger = logging.getLogger(__name__)
 
 CandidateModelT = TypeVar("CandidateModelT", bound=BaseModel)
-_CODE_BLOCK_PATTERN = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+
+# Wrapper model and converter method per supported output_type; a clean
+# payload validates straight into the model from JSON.
+_OUTPUT_TYPES: Dict[str, Tuple[Type[BaseModel], str]] = {
+    "lodging": (LodgingAgentOutput, "_convert_to_lodging_output"),
+    "activities": (ActivitiesAgentOutput, "_convert_to_activities_output"),
+    "food": (FoodAgentOutput, "_convert_to_food_output"),
+    "intercity_transport": (IntercityTransportAgentOutput, "_convert_to_intercity_transport_output"),
+    "recommendations": (RecommendationsOutput, "_convert_to_recommendations_output"),
+}
+
+
+def _iter_fenced_blocks(text: str) -> Iterator[str]:
+    """Yield the bodies of ``` fenced blocks, dropping an optional ``json`` tag."""
+    position = 0
+    while True:
+        start = text.find("```", position)
+        if start == -1:
+            return
+        body_start = start + 3
+        if text.startswith("json", body_start):
+            body_start += 4
+        end = text.find("```", body_start)
+        if end == -1:
+            return
+        yield text[body_start:end]
+        position = end + 3
 
 
 class PydanticPostModelHook(BaseCallbackHandler):
     """Post-model hook that converts raw LLM output into proper Pydantic models."""
-    
+
     def __init__(self, output_type: str):
         self.output_type = output_type  # "lodging", "activities", "food", "intercity_transport", "recommendations"
         self.raw_output: Optional[str] = None
 
-        if self.output_type not in {"lodging", "activities", "food", "intercity_transport", "recommendations"}:
+        if self.output_type not in _OUTPUT_TYPES:
             raise ValueError(f"Unsupported output_type '{self.output_type}' for PydanticPostModelHook")
+        output_model, converter_name = _OUTPUT_TYPES[self.output_type]
+        self._output_model: Type[BaseModel] = output_model
+        self._converter: Callable[[Any], BaseModel] = getattr(self, converter_name)
 
     def on_chain_start(self, *args, **kwargs) -> None:
         """Reset captured state before each chain execution."""
@@ -98,22 +128,18 @@ class PydanticPostModelHook(BaseCallbackHandler):
     def _convert_to_pydantic_model(self, raw_output: str) -> Optional[Any]:
         """Convert raw output to the appropriate Pydantic model."""
         try:
+            # Fast path: the whole payload is already a valid wrapper object
+            try:
+                return self._output_model.model_validate_json(raw_output)
+            except ValidationError:
+                pass
+
             # Extract JSON from raw output
             json_data = self._extract_json_from_output(raw_output)
             if json_data is None:
                 return None
-            
-            # Convert based on output type
-            if self.output_type == "lodging":
-                return self._convert_to_lodging_output(json_data)
-            elif self.output_type == "activities":
-                return self._convert_to_activities_output(json_data)
-            elif self.output_type == "food":
-                return self._convert_to_food_output(json_data)
-            elif self.output_type == "intercity_transport":
-                return self._convert_to_intercity_transport_output(json_data)
-            elif self.output_type == "recommendations":
-                return self._convert_to_recommendations_output(json_data)
+
+            return self._converter(json_data)
             
         except Exception as e:
             logger.exception("Error converting %s output: %s", self.output_type, e)
@@ -124,34 +150,41 @@ class PydanticPostModelHook(BaseCallbackHandler):
         if not raw_output:
             return None
 
-        candidates: List[str] = []
         stripped = raw_output.strip()
-        if stripped:
+        if not stripped:
+            return None
+
+        last_error: Optional[ValueError] = None
+        candidates: List[str] = []
+
+        # Common case: the model returned bare JSON with no fences or prose
+        if stripped[0] in "{[" and stripped[-1] in "}]":
+            try:
+                return from_json(stripped)
+            except ValueError as exc:
+                last_error = exc
+        else:
             candidates.append(stripped)
 
         # Extract code-fenced JSON blocks if present (```json ... ```)
-        for match in _CODE_BLOCK_PATTERN.finditer(raw_output):
-            block = match.group(1).strip()
+        for block in _iter_fenced_blocks(stripped):
+            block = block.strip()
             if block:
                 candidates.append(block)
 
         # Attempt to isolate the first JSON object/array within the text
-        start_positions = [
-            idx for idx in (stripped.find("{"), stripped.find("[")) if idx != -1
-        ]
+        start_positions = [idx for idx in (stripped.find("{"), stripped.find("[")) if idx != -1]
         if start_positions:
             start_idx = min(start_positions)
-            opening_char = stripped[start_idx]
-            closing_char = "}" if opening_char == "{" else "]"
-            end_idx = stripped.rfind(closing_char)
-            if end_idx != -1 and end_idx >= start_idx:
-                candidates.append(stripped[start_idx : end_idx + 1].strip())
+            end_idx = max(stripped.rfind("}"), stripped.rfind("]"))
+            # A span covering the whole text was already tried above
+            if end_idx > start_idx and (start_idx, end_idx) != (0, len(stripped) - 1):
+                candidates.append(stripped[start_idx : end_idx + 1])
 
-        last_error: Optional[json.JSONDecodeError] = None
         for candidate in dict.fromkeys(candidates):
             try:
-                return json.loads(candidate)
-            except json.JSONDecodeError as exc:
+                return from_json(candidate)
+            except ValueError as exc:
                 last_error = exc
                 continue
 
@@ -171,25 +204,34 @@ class PydanticPostModelHook(BaseCallbackHandler):
     ) -> BaseModel:
         """Shared helper to build agent outputs while tolerating partial failures."""
         entries = self._normalise_collection(json_data, collection_key)
+
+        # Clean batches validate in a single call; any bad entry falls back to
+        # the per-item loop so it can be logged and dropped on its own.
+        list_adapter = CANDIDATE_LIST_ADAPTERS.get(output_field)
+        if list_adapter is not None:
+            try:
+                return fast_wrap(wrap_output, **{output_field: list_adapter.validate_python(entries)})
+            except ValidationError:
+                pass
+
         candidates: List[CandidateModelT] = []
 
         for idx, item in enumerate(entries):
             if item is None:
                 continue
 
-            item_data = dict(item) if isinstance(item, dict) else item
-            if not isinstance(item_data, dict):
+            if not isinstance(item, dict):
                 logger.debug(
                     "Skipping %s candidate at position %s; expected dict-like structure, got %s",
                     candidate_model.__name__,
                     idx,
-                    type(item_data).__name__,
+                    type(item).__name__,
                 )
                 continue
 
             if item_transform is not None:
                 try:
-                    item_data = item_transform(item_data)
+                    item = item_transform(item)
                 except Exception as exc:
                     logger.warning(
                         "Failed to transform %s candidate at position %s: %s",
@@ -200,7 +242,7 @@ class PydanticPostModelHook(BaseCallbackHandler):
                     continue
 
             try:
-                candidates.append(candidate_model(**item_data))
+                candidates.append(candidate_model.model_validate(item))
             except ValidationError as exc:
                 logger.warning(
                     "Skipping %s candidate at position %s due to validation error: %s",
@@ -209,7 +251,8 @@ class PydanticPostModelHook(BaseCallbackHandler):
                     exc,
                 )
 
-        return wrap_output(**{output_field: candidates})
+        # Every candidate was validated above; skip re-validating the list.
+        return fast_wrap(wrap_output, **{output_field: candidates})
 
     @staticmethod
     def _normalise_collection(json_data: Any, key: Optional[Union[str, Sequence[str]]]) -> Sequence[Any]:
@@ -280,7 +323,7 @@ class PydanticPostModelHook(BaseCallbackHandler):
                         logger.debug("Skipping non-dict transfer leg: %s", leg)
                         continue
                     try:
-                        normalised_transfers.append(Transfer(**leg))
+                        normalised_transfers.append(Transfer.model_validate(leg))
                     except ValidationError as exc:
                         logger.warning("Skipping transfer leg due to validation error: %s", exc)
                 mutated["transfer"] = normalised_transfers
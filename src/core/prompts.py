@@ -1,3 +1,98 @@
+import json
+from typing import Any, Dict, Tuple
+
+# Blocks shared by several templates; composed once at import.
+_TRIP_FACTS = """- Destination: {destination}, {destination_country}
+- Travel Dates: {date_from} to {date_to} ({days_number} days)
+- Group Type: {group_type}
+- Group Size: {adults_num} adults, {children_num} children, {infant_num} infants
+- Trip Purpose: {trip_purpose}"""
+
+_TRAVELLER_INFORMATION = """traveller INFORMATION:
+{traveller_context}"""
+
+
+def _research_requirements(options: str) -> str:
+    return f"""RESEARCH REQUIREMENTS:
+- Find exactly {{candidates_number}} {options}
+- Research Task: {{research_name}}
+- Specific Requirements: {{research_description}}"""
+
+
+def _format_examples(examples: Tuple[Tuple[str, Dict[str, Any]], ...]) -> str:
+    """Render few-shot examples as compact JSON, brace-escaped for str.format."""
+    rendered = (
+        f"Example {number} - {title}:\n"
+        + json.dumps(payload, separators=(",", ":"), ensure_ascii=False).replace("{", "{{").replace("}", "}}")
+        for number, (title, payload) in enumerate(examples, start=1)
+    )
+    return "\n\n".join(rendered)
+
+
+_BUDGET_EXAMPLES = (
+    (
+        "Budget Solo Travel (Tokyo, Japan, 5 days, $800 USD)",
+        {
+            "budget_level": "$$",
+            "currency": "USD",
+            "intercity_transport": 300.0,
+            "local_transport": 50.0,
+            "food": 150.0,
+            "activities": 120.0,
+            "lodging": 150.0,
+            "other": 30.0,
+            "budget_per_day": 160.0,
+            "notes": "Budget breakdown for solo traveller in Tokyo. Intercity transport includes round-trip flight from Seoul. Local transport covers metro/bus passes. Food budget allows for mix of convenience store meals and local restaurants. Activities include museum visits and temple tours. Lodging assumes mid-range hotel or capsule hotel. Other covers souvenirs and small expenses."
+        },
+    ),
+    (
+        "Mid-Range Couple Travel (Paris, France, 7 days, $2500 USD)",
+        {
+            "budget_level": "$$$",
+            "currency": "USD",
+            "intercity_transport": 800.0,
+            "local_transport": 140.0,
+            "food": 700.0,
+            "activities": 420.0,
+            "lodging": 350.0,
+            "other": 90.0,
+            "budget_per_day": 357.14,
+            "notes": "Mid-range couple's trip to Paris. Intercity transport includes economy flights from major US city. Local transport covers metro passes and occasional taxi rides. Food budget allows for nice restaurants and cafes. Activities include museum passes, Seine cruise, and guided tours. Lodging assumes 3-star hotel. Other covers tips, souvenirs, and incidentals."
+        },
+    ),
+    (
+        "Budget Family Travel (Bangkok, Thailand, 10 days, $1500 USD)",
+        {
+            "budget_level": "$",
+            "currency": "USD",
+            "intercity_transport": 600.0,
+            "local_transport": 80.0,
+            "food": 300.0,
+            "activities": 200.0,
+            "lodging": 280.0,
+            "other": 40.0,
+            "budget_per_day": 150.0,
+            "notes": "Budget family trip to Bangkok for 4 people. Intercity transport includes flights for family of 4. Local transport covers tuk-tuks and public transport. Food budget focuses on street food and local restaurants. Activities include temple visits and cultural experiences. Lodging assumes family rooms or budget hotels. Other covers minimal souvenirs and basic expenses."
+        },
+    ),
+    (
+        "Luxury Solo Travel (Switzerland, 8 days, $5000 USD)",
+        {
+            "budget_level": "$$$$",
+            "currency": "USD",
+            "intercity_transport": 1200.0,
+            "local_transport": 200.0,
+            "food": 800.0,
+            "activities": 1500.0,
+            "lodging": 1200.0,
+            "other": 100.0,
+            "budget_per_day": 625.0,
+            "notes": "Luxury solo trip to Switzerland. Intercity transport includes business class flights and scenic train routes. Local transport covers first-class train tickets and private transfers. Food budget allows for fine dining and Michelin-starred restaurants. Activities include premium experiences like Jungfraujoch, luxury spa treatments, and private tours. Lodging assumes 4-5 star hotels. Other covers high-end souvenirs and premium services."
+        },
+    ),
+)
+
+
 budget_estimate_prompt = """You are an expert travel budget analyst. Create a detailed budget breakdown for the following trip:
 
 TRIP OVERVIEW:
@@ -51,61 +146,7 @@ OUTPUT REQUIREMENTS:
 
 EXAMPLES:
 
-Example 1 - Budget Solo Travel (Tokyo, Japan, 5 days, $800 USD):
-{{
-  "budget_level": "$$",
-  "currency": "USD",
-  "intercity_transport": 300.0,
-  "local_transport": 50.0,
-  "food": 150.0,
-  "activities": 120.0,
-  "lodging": 150.0,
-  "other": 30.0,
-  "budget_per_day": 160.0,
-  "notes": "Budget breakdown for solo traveller in Tokyo. Intercity transport includes round-trip flight from Seoul. Local transport covers metro/bus passes. Food budget allows for mix of convenience store meals and local restaurants. Activities include museum visits and temple tours. Lodging assumes mid-range hotel or capsule hotel. Other covers souvenirs and small expenses."
-}}
-
-Example 2 - Mid-Range Couple Travel (Paris, France, 7 days, $2500 USD):
-{{
-  "budget_level": "$$$",
-  "currency": "USD",
-  "intercity_transport": 800.0,
-  "local_transport": 140.0,
-  "food": 700.0,
-  "activities": 420.0,
-  "lodging": 350.0,
-  "other": 90.0,
-  "budget_per_day": 357.14,
-  "notes": "Mid-range couple's trip to Paris. Intercity transport includes economy flights from major US city. Local transport covers metro passes and occasional taxi rides. Food budget allows for nice restaurants and cafes. Activities include museum passes, Seine cruise, and guided tours. Lodging assumes 3-star hotel. Other covers tips, souvenirs, and incidentals."
-}}
-
-Example 3 - Budget Family Travel (Bangkok, Thailand, 10 days, $1500 USD):
-{{
-  "budget_level": "$",
-  "currency": "USD",
-  "intercity_transport": 600.0,
-  "local_transport": 80.0,
-  "food": 300.0,
-  "activities": 200.0,
-  "lodging": 280.0,
-  "other": 40.0,
-  "budget_per_day": 150.0,
-  "notes": "Budget family trip to Bangkok for 4 people. Intercity transport includes flights for family of 4. Local transport covers tuk-tuks and public transport. Food budget focuses on street food and local restaurants. Activities include temple visits and cultural experiences. Lodging assumes family rooms or budget hotels. Other covers minimal souvenirs and basic expenses."
-}}
-
-Example 4 - Luxury Solo Travel (Switzerland, 8 days, $5000 USD):
-{{
-  "budget_level": "$$$$",
-  "currency": "USD",
-  "intercity_transport": 1200.0,
-  "local_transport": 200.0,
-  "food": 800.0,
-  "activities": 1500.0,
-  "lodging": 1200.0,
-  "other": 100.0,
-  "budget_per_day": 625.0,
-  "notes": "Luxury solo trip to Switzerland. Intercity transport includes business class flights and scenic train routes. Local transport covers first-class train tickets and private transfers. Food budget allows for fine dining and Michelin-starred restaurants. Activities include premium experiences like Jungfraujoch, luxury spa treatments, and private tours. Lodging assumes 4-5 star hotels. Other covers high-end souvenirs and premium services."
-}}
+""" + _format_examples(_BUDGET_EXAMPLES) + """
 
 REASONING PATTERNS:
 
@@ -140,16 +181,91 @@ REASONING PATTERNS:
    - Mid-range activities: Guided tours ($50-150), shows ($30-100)
    - High-end activities: Private tours ($150-500), premium experiences ($100-300)
 
-{notes}"""
+{additional_context}"""
+
+_RESEARCH_PLAN_EXAMPLES = (
+    (
+        "Budget Family Trip (Bangkok, 10 days, $1500)",
+        {
+            "lodging_candidates": {
+                "name": "Family-Friendly Budget Accommodations",
+                "description": "Hotels and vacation rentals suitable for families with children, budget-friendly options with family rooms or connecting rooms, good location for family activities",
+                "candidates_number": 5
+            },
+            "activities_candidates": {
+                "name": "Family Activities and Cultural Experiences",
+                "description": "Child-friendly attractions, cultural sites, temples, markets, and educational activities suitable for families with kids",
+                "candidates_number": 6
+            },
+            "food_candidates": {
+                "name": "Family-Friendly Local Dining",
+                "description": "Restaurants with family menus, local cuisine that kids can enjoy, street food options, and places with high chairs",
+                "candidates_number": 4
+            },
+            "intercity_transport_candidates": {
+                "name": "Family Transport Options",
+                "description": "Economy flights for family of 4, ground transport options, family-friendly airlines with good baggage allowances",
+                "candidates_number": 3
+            }
+        },
+    ),
+    (
+        "Luxury Solo Travel (Switzerland, 8 days, $5000)",
+        {
+            "lodging_candidates": {
+                "name": "Luxury Alpine Accommodations",
+                "description": "5-star hotels, luxury chalets, and premium accommodations in scenic locations with exceptional service and amenities",
+                "candidates_number": 3
+            },
+            "activities_candidates": {
+                "name": "Premium Swiss Experiences",
+                "description": "Private tours, luxury spa treatments, exclusive mountain experiences, fine dining experiences, and premium cultural activities",
+                "candidates_number": 4
+            },
+            "food_candidates": {
+                "name": "Fine Dining and Culinary Excellence",
+                "description": "Michelin-starred restaurants, luxury dining experiences, premium local cuisine, and exclusive culinary tours",
+                "candidates_number": 3
+            },
+            "intercity_transport_candidates": {
+                "name": "Premium Transport and Scenic Routes",
+                "description": "Business class flights, first-class train tickets, private transfers, and scenic route options for luxury travel",
+                "candidates_number": 2
+            }
+        },
+    ),
+    (
+        "Mid-Range Couple Trip (Paris, 7 days, $2500)",
+        {
+            "lodging_candidates": {
+                "name": "Romantic Parisian Hotels",
+                "description": "Boutique hotels, romantic accommodations in central Paris, 3-4 star properties with charm and good location for couples",
+                "candidates_number": 4
+            },
+            "activities_candidates": {
+                "name": "Romantic and Cultural Paris Experiences",
+                "description": "Romantic activities, museum visits, Seine cruises, cultural tours, and couple-friendly experiences in Paris",
+                "candidates_number": 5
+            },
+            "food_candidates": {
+                "name": "Romantic Dining and Parisian Cuisine",
+                "description": "Romantic restaurants, traditional Parisian bistros, cafes, and dining experiences perfect for couples",
+                "candidates_number": 4
+            },
+            "intercity_transport_candidates": {
+                "name": "Comfortable Travel to Paris",
+                "description": "Economy flights with good connections, comfortable ground transport, and convenient arrival/departure options",
+                "candidates_number": 3
+            }
+        },
+    ),
+)
+
 
 research_plan_prompt = """You are an expert travel research strategist. Create a comprehensive research plan that determines how many candidates each specialized agent should find for the following trip.
 
 TRIP OVERVIEW:
-- Destination: {destination}, {destination_country}
-- Travel Dates: {date_from} to {date_to} ({days_number} days)
-- Group Type: {group_type}
-- Group Size: {adults_num} adults, {children_num} children, {infant_num} infants
-- Trip Purpose: {trip_purpose}
+""" + _TRIP_FACTS + """
 - Budget Level: {budget_level} (Total: {total_budget} {currency})
 
 BUDGET BREAKDOWN:
@@ -230,77 +346,7 @@ DECISION FACTORS:
 
 EXAMPLES:
 
-Example 1 - Budget Family Trip (Bangkok, 10 days, $1500):
-{{
-  "lodging_candidates": {{
-    "name": "Family-Friendly Budget Accommodations",
-    "description": "Hotels and vacation rentals suitable for families with children, budget-friendly options with family rooms or connecting rooms, good location for family activities",
-    "candidates_number": 5
-  }},
-  "activities_candidates": {{
-    "name": "Family Activities and Cultural Experiences",
-    "description": "Child-friendly attractions, cultural sites, temples, markets, and educational activities suitable for families with kids",
-    "candidates_number": 6
-  }},
-  "food_candidates": {{
-    "name": "Family-Friendly Local Dining",
-    "description": "Restaurants with family menus, local cuisine that kids can enjoy, street food options, and places with high chairs",
-    "candidates_number": 4
-  }},
-  "intercity_transport_candidates": {{
-    "name": "Family Transport Options",
-    "description": "Economy flights for family of 4, ground transport options, family-friendly airlines with good baggage allowances",
-    "candidates_number": 3
-  }}
-}}
-
-Example 2 - Luxury Solo Travel (Switzerland, 8 days, $5000):
-{{
-  "lodging_candidates": {{
-    "name": "Luxury Alpine Accommodations",
-    "description": "5-star hotels, luxury chalets, and premium accommodations in scenic locations with exceptional service and amenities",
-    "candidates_number": 3
-  }},
-  "activities_candidates": {{
-    "name": "Premium Swiss Experiences",
-    "description": "Private tours, luxury spa treatments, exclusive mountain experiences, fine dining experiences, and premium cultural activities",
-    "candidates_number": 4
-  }},
-  "food_candidates": {{
-    "name": "Fine Dining and Culinary Excellence",
-    "description": "Michelin-starred restaurants, luxury dining experiences, premium local cuisine, and exclusive culinary tours",
-    "candidates_number": 3
-  }},
-  "intercity_transport_candidates": {{
-    "name": "Premium Transport and Scenic Routes",
-    "description": "Business class flights, first-class train tickets, private transfers, and scenic route options for luxury travel",
-    "candidates_number": 2
-  }}
-}}
-
-Example 3 - Mid-Range Couple Trip (Paris, 7 days, $2500):
-{{
-  "lodging_candidates": {{
-    "name": "Romantic Parisian Hotels",
-    "description": "Boutique hotels, romantic accommodations in central Paris, 3-4 star properties with charm and good location for couples",
-    "candidates_number": 4
-  }},
-  "activities_candidates": {{
-    "name": "Romantic and Cultural Paris Experiences",
-    "description": "Romantic activities, museum visits, Seine cruises, cultural tours, and couple-friendly experiences in Paris",
-    "candidates_number": 5
-  }},
-  "food_candidates": {{
-    "name": "Romantic Dining and Parisian Cuisine",
-    "description": "Romantic restaurants, traditional Parisian bistros, cafes, and dining experiences perfect for couples",
-    "candidates_number": 4
-  }},
-  "intercity_transport_candidates": {{
-    "name": "Comfortable Travel to Paris",
-    "description": "Economy flights with good connections, comfortable ground transport, and convenient arrival/departure options",
-    "candidates_number": 3
-  }}
-}}
+""" + _format_examples(_RESEARCH_PLAN_EXAMPLES) + """
 
 OUTPUT REQUIREMENTS:
 - Set candidates_number between 0-10 for each category
@@ -313,23 +359,75 @@ OUTPUT REQUIREMENTS:
 
 {additional_context}"""
 
+_LODGING_EXAMPLES = (
+    (
+        "Budget Solo traveller (Tokyo)",
+        {
+            "id": "12345",
+            "name": "Sakura Hostel Tokyo",
+            "address": "2-5-4 Asakusa, Taito City, Tokyo 111-0032",
+            "area": "Asakusa",
+            "price_level": "$",
+            "price_night": 25.0,
+            "rating": 4.2,
+            "reviews": [
+                "Great location near Senso-ji Temple",
+                "Clean facilities and friendly staff",
+                "Perfect for solo travellers"
+            ],
+            "photos": [
+                "https://example.com/photo1.jpg",
+                "https://example.com/photo2.jpg"
+            ],
+            "url": "https://tripadvisor.com/hotel/12345",
+            "lat": 35.7123,
+            "lon": 139.7969,
+            "cancel_policy": "Free cancellation up to 24 hours before check-in",
+            "evidence_score": 0.9,
+            "source_id": "tripadvisor",
+            "notes": "Popular with solo travellers, has social areas and tours desk"
+        },
+    ),
+    (
+        "Mid-Range Family (Paris)",
+        {
+            "id": "67890",
+            "name": "Hotel des Familles",
+            "address": "15 Rue de Rivoli, 75001 Paris, France",
+            "area": "Le Marais",
+            "price_level": "$$",
+            "price_night": 180.0,
+            "rating": 4.5,
+            "reviews": [
+                "Perfect for families with children",
+                "Spacious family rooms",
+                "Great location near attractions"
+            ],
+            "photos": [
+                "https://example.com/family1.jpg",
+                "https://example.com/family2.jpg"
+            ],
+            "url": "https://booking.com/hotel/67890",
+            "lat": 48.8566,
+            "lon": 2.3522,
+            "cancel_policy": "Free cancellation up to 48 hours before arrival",
+            "evidence_score": 0.95,
+            "source_id": "booking",
+            "notes": "Family-friendly amenities include playground and babysitting services"
+        },
+    ),
+)
+
+
 lodging_research_prompt =  """You are an expert lodging research specialist. Find high-quality accommodation options that perfectly match the trip requirements.
 
 TRIP CONTEXT:
-- Destination: {destination}, {destination_country}
-- Travel Dates: {date_from} to {date_to} ({days_number} days)
-- Group Type: {group_type}
-- Group Size: {adults_num} adults, {children_num} children, {infant_num} infants
-- Trip Purpose: {trip_purpose}
+""" + _TRIP_FACTS + """
 - Total Lodging Budget: {lodging_budget} {currency}
 
-traveller INFORMATION:
-{traveller_context}
+""" + _TRAVELLER_INFORMATION + """
 
-RESEARCH REQUIREMENTS:
-- Find exactly {candidates_number} lodging options
-- Research Task: {research_name}
-- Specific Requirements: {research_description}
+""" + _research_requirements("lodging options") + """
 
 LODGING RESEARCH CRITERIA:
 
@@ -379,45 +477,7 @@ LODGING RESEARCH CRITERIA:
 
 **EXAMPLES**:
 
-Example 1 - Budget Solo traveller (Tokyo):
-{{
-  "id": "12345",
-  "name": "Sakura Hostel Tokyo",
-  "address": "2-5-4 Asakusa, Taito City, Tokyo 111-0032",
-  "area": "Asakusa",
-  "price_level": "$",
-  "price_night": 25.0,
-  "rating": 4.2,
-  "reviews": ["Great location near Senso-ji Temple", "Clean facilities and friendly staff", "Perfect for solo travellers"],
-  "photos": ["https://example.com/photo1.jpg", "https://example.com/photo2.jpg"],
-  "url": "https://tripadvisor.com/hotel/12345",
-  "lat": 35.7123,
-  "lon": 139.7969,
-  "cancel_policy": "Free cancellation up to 24 hours before check-in",
-  "evidence_score": 0.9,
-  "source_id": "tripadvisor",
-  "notes": "Popular with solo travellers, has social areas and tours desk"
-}}
-
-Example 2 - Mid-Range Family (Paris):
-{{
-  "id": "67890",
-  "name": "Hotel des Familles",
-  "address": "15 Rue de Rivoli, 75001 Paris, France",
-  "area": "Le Marais",
-  "price_level": "$$",
-  "price_night": 180.0,
-  "rating": 4.5,
-  "reviews": ["Perfect for families with children", "Spacious family rooms", "Great location near attractions"],
-  "photos": ["https://example.com/family1.jpg", "https://example.com/family2.jpg"],
-  "url": "https://booking.com/hotel/67890",
-  "lat": 48.8566,
-  "lon": 2.3522,
-  "cancel_policy": "Free cancellation up to 48 hours before arrival",
-  "evidence_score": 0.95,
-  "source_id": "booking",
-  "notes": "Family-friendly amenities include playground and babysitting services"
-}}
+""" + _format_examples(_LODGING_EXAMPLES) + """
 
 **STRICT OUTPUT FORMAT (MANDATORY)**:
 - Respond with a single JSON object exactly in this form:
@@ -449,23 +509,125 @@ Example 2 - Mid-Range Family (Paris):
 
 {additional_context}"""
 
+_ACTIVITIES_EXAMPLES = (
+    (
+        "Family Activities (Tokyo)",
+        {
+            "id": "12345",
+            "name": "Tokyo National Museum",
+            "address": "13-9 Ueno Park, Taito City, Tokyo 110-8712",
+            "price_level": "$$",
+            "rating": 4.3,
+            "reviews": [
+                "Great for families with kids",
+                "Educational and interesting exhibits",
+                "Beautiful building and gardens"
+            ],
+            "photos": [
+                "https://example.com/museum1.jpg",
+                "https://example.com/museum2.jpg"
+            ],
+            "url": "https://tripadvisor.com/attraction/12345",
+            "lat": 35.7167,
+            "lon": 139.7767,
+            "open_time": "09:30",
+            "close_time": "17:00",
+            "duration_min": 180,
+            "price": 15.0,
+            "tags": [
+                "cultural",
+                "family-friendly",
+                "educational",
+                "indoor"
+            ],
+            "evidence_score": 0.95,
+            "source_id": "tripadvisor",
+            "notes": "Free admission for children under 18, audio guides available in multiple languages"
+        },
+    ),
+    (
+        "Romantic Couple Activity (Paris)",
+        {
+            "id": "67890",
+            "name": "Seine River Dinner Cruise",
+            "address": "Port de la Bourdonnais, 75007 Paris, France",
+            "price_level": "$$$",
+            "rating": 4.6,
+            "reviews": [
+                "Perfect for couples",
+                "Romantic atmosphere with beautiful views",
+                "Excellent food and service"
+            ],
+            "photos": [
+                "https://example.com/cruise1.jpg",
+                "https://example.com/cruise2.jpg"
+            ],
+            "url": "https://viator.com/tours/67890",
+            "lat": 48.8566,
+            "lon": 2.3522,
+            "open_time": "19:00",
+            "close_time": "22:00",
+            "duration_min": 180,
+            "price": 120.0,
+            "tags": [
+                "romantic",
+                "dining",
+                "scenic",
+                "evening"
+            ],
+            "evidence_score": 0.9,
+            "source_id": "viator",
+            "notes": "Includes 3-course dinner, drinks, and live music. Book in advance for best seating"
+        },
+    ),
+    (
+        "Solo traveller Activity (Bangkok)",
+        {
+            "id": "54321",
+            "name": "Bangkok Street Food Walking Tour",
+            "address": "Meeting point at BTS Saphan Taksin Station",
+            "price_level": "$",
+            "rating": 4.8,
+            "reviews": [
+                "Great way to meet other travellers",
+                "Amazing local food",
+                "Knowledgeable guide"
+            ],
+            "photos": [
+                "https://example.com/food1.jpg",
+                "https://example.com/food2.jpg"
+            ],
+            "url": "https://tripadvisor.com/experience/54321",
+            "lat": 13.72,
+            "lon": 100.5,
+            "open_time": "18:00",
+            "close_time": "21:00",
+            "duration_min": 180,
+            "price": 35.0,
+            "tags": [
+                "food",
+                "cultural",
+                "social",
+                "evening",
+                "walking"
+            ],
+            "evidence_score": 0.9,
+            "source_id": "tripadvisor",
+            "notes": "Small group tour, includes all food tastings, vegetarian options available"
+        },
+    ),
+)
+
+
 activities_research_prompt = """You are an expert activities and attractions research specialist. Find engaging and memorable experiences that perfectly match the trip requirements and traveller interests.
 
 TRIP CONTEXT:
-- Destination: {destination}, {destination_country}
-- Travel Dates: {date_from} to {date_to} ({days_number} days)
-- Group Type: {group_type}
-- Group Size: {adults_num} adults, {children_num} children, {infant_num} infants
-- Trip Purpose: {trip_purpose}
+""" + _TRIP_FACTS + """
 - Total Activities Budget: {activities_budget} {currency}
 
-traveller INFORMATION:
-{traveller_context}
+""" + _TRAVELLER_INFORMATION + """
 
-RESEARCH REQUIREMENTS:
-- Find exactly {candidates_number} activity options
-- Research Task: {research_name}
-- Specific Requirements: {research_description}
+""" + _research_requirements("activity options") + """
 
 ACTIVITY RESEARCH CRITERIA:
 
@@ -544,71 +706,7 @@ ACTIVITY RESEARCH CRITERIA:
 
 **EXAMPLES**:
 
-Example 1 - Family Activities (Tokyo):
-{{
-  "id": "12345",
-  "name": "Tokyo National Museum",
-  "address": "13-9 Ueno Park, Taito City, Tokyo 110-8712",
-  "price_level": "$$",
-  "rating": 4.3,
-  "reviews": ["Great for families with kids", "Educational and interesting exhibits", "Beautiful building and gardens"],
-  "photos": ["https://example.com/museum1.jpg", "https://example.com/museum2.jpg"],
-  "url": "https://tripadvisor.com/attraction/12345",
-  "lat": 35.7167,
-  "lon": 139.7767,
-  "open_time": "09:30",
-  "close_time": "17:00",
-  "duration_min": 180,
-  "price": 15.0,
-  "tags": ["cultural", "family-friendly", "educational", "indoor"],
-  "evidence_score": 0.95,
-  "source_id": "tripadvisor",
-  "notes": "Free admission for children under 18, audio guides available in multiple languages"
-}}
-
-Example 2 - Romantic Couple Activity (Paris):
-{{
-  "id": "67890",
-  "name": "Seine River Dinner Cruise",
-  "address": "Port de la Bourdonnais, 75007 Paris, France",
-  "price_level": "$$$",
-  "rating": 4.6,
-  "reviews": ["Perfect for couples", "Romantic atmosphere with beautiful views", "Excellent food and service"],
-  "photos": ["https://example.com/cruise1.jpg", "https://example.com/cruise2.jpg"],
-  "url": "https://viator.com/tours/67890",
-  "lat": 48.8566,
-  "lon": 2.3522,
-  "open_time": "19:00",
-  "close_time": "22:00",
-  "duration_min": 180,
-  "price": 120.0,
-  "tags": ["romantic", "dining", "scenic", "evening"],
-  "evidence_score": 0.9,
-  "source_id": "viator",
-  "notes": "Includes 3-course dinner, drinks, and live music. Book in advance for best seating"
-}}
-
-Example 3 - Solo traveller Activity (Bangkok):
-{{
-  "id": "54321",
-  "name": "Bangkok Street Food Walking Tour",
-  "address": "Meeting point at BTS Saphan Taksin Station",
-  "price_level": "$",
-  "rating": 4.8,
-  "reviews": ["Great way to meet other travellers", "Amazing local food", "Knowledgeable guide"],
-  "photos": ["https://example.com/food1.jpg", "https://example.com/food2.jpg"],
-  "url": "https://tripadvisor.com/experience/54321",
-  "lat": 13.7200,
-  "lon": 100.5000,
-  "open_time": "18:00",
-  "close_time": "21:00",
-  "duration_min": 180,
-  "price": 35.0,
-  "tags": ["food", "cultural", "social", "evening", "walking"],
-  "evidence_score": 0.9,
-  "source_id": "tripadvisor",
-  "notes": "Small group tour, includes all food tastings, vegetarian options available"
-}}
+""" + _format_examples(_ACTIVITIES_EXAMPLES) + """
 
 **STRICT OUTPUT FORMAT (MANDATORY)**:
 - Return ONLY a single JSON object matching this schema exactly:
@@ -642,23 +740,152 @@ Example 3 - Solo traveller Activity (Bangkok):
 
 {additional_context}"""
 
+_FOOD_EXAMPLES = (
+    (
+        "Family Dining (Tokyo)",
+        {
+            "id": "12345",
+            "name": "Tonkatsu Wako",
+            "address": "1-2-1 Nihonbashi, Chuo City, Tokyo 103-0027",
+            "price_level": "$$",
+            "rating": 4.4,
+            "reviews": [
+                "Great for families with children",
+                "Authentic tonkatsu",
+                "Friendly service and clean environment"
+            ],
+            "photos": [
+                "https://example.com/tonkatsu1.jpg",
+                "https://example.com/tonkatsu2.jpg"
+            ],
+            "url": "https://tripadvisor.com/restaurant/12345",
+            "lat": 35.6812,
+            "lon": 139.7671,
+            "open_time": "11:30",
+            "close_time": "21:30",
+            "tags": [
+                "japanese",
+                "family-friendly",
+                "traditional",
+                "tonkatsu"
+            ],
+            "evidence_score": 0.9,
+            "source_id": "tripadvisor",
+            "notes": "Child-friendly portions available, English menu available, accepts reservations"
+        },
+    ),
+    (
+        "Romantic Dining (Paris)",
+        {
+            "id": "67890",
+            "name": "Le Comptoir du Relais",
+            "address": "9 Carrefour de l'Odéon, 75006 Paris, France",
+            "price_level": "$$$",
+            "rating": 4.6,
+            "reviews": [
+                "Perfect for romantic dinners",
+                "Authentic French bistro",
+                "Excellent wine selection"
+            ],
+            "photos": [
+                "https://example.com/bistro1.jpg",
+                "https://example.com/bistro2.jpg"
+            ],
+            "url": "https://tripadvisor.com/restaurant/67890",
+            "lat": 48.8534,
+            "lon": 2.3488,
+            "open_time": "12:00",
+            "close_time": "23:00",
+            "tags": [
+                "french",
+                "romantic",
+                "bistro",
+                "wine"
+            ],
+            "evidence_score": 0.95,
+            "source_id": "tripadvisor",
+            "notes": "Popular with locals, reservations recommended, romantic atmosphere in Saint-Germain"
+        },
+    ),
+    (
+        "Solo traveller Street Food (Bangkok)",
+        {
+            "id": "54321",
+            "name": "Jay Fai Street Food",
+            "address": "327 Maha Chai Rd, Samran Rat, Phra Nakhon, Bangkok 10200",
+            "price_level": "$",
+            "rating": 4.7,
+            "reviews": [
+                "Amazing street food experience",
+                "Famous crab omelet",
+                "Worth the wait"
+            ],
+            "photos": [
+                "https://example.com/street1.jpg",
+                "https://example.com/street2.jpg"
+            ],
+            "url": "https://tripadvisor.com/restaurant/54321",
+            "lat": 13.7563,
+            "lon": 100.5018,
+            "open_time": "17:00",
+            "close_time": "02:00",
+            "tags": [
+                "thai",
+                "street-food",
+                "local",
+                "famous",
+                "late-night"
+            ],
+            "evidence_score": 0.9,
+            "source_id": "tripadvisor",
+            "notes": "Michelin-starred street food, expect long queues, cash only, famous for crab omelet"
+        },
+    ),
+    (
+        "Group Dining (New York)",
+        {
+            "id": "98765",
+            "name": "Carmine's Italian Restaurant",
+            "address": "200 W 44th St, New York, NY 10036",
+            "price_level": "$$$",
+            "rating": 4.3,
+            "reviews": [
+                "Perfect for large groups",
+                "Family-style portions",
+                "Great for celebrations"
+            ],
+            "photos": [
+                "https://example.com/italian1.jpg",
+                "https://example.com/italian2.jpg"
+            ],
+            "url": "https://tripadvisor.com/restaurant/98765",
+            "lat": 40.7589,
+            "lon": -73.9851,
+            "open_time": "11:30",
+            "close_time": "23:00",
+            "tags": [
+                "italian",
+                "group-friendly",
+                "family-style",
+                "theater-district"
+            ],
+            "evidence_score": 0.9,
+            "source_id": "tripadvisor",
+            "notes": "Family-style portions perfect for groups, near Broadway theaters, reservations recommended"
+        },
+    ),
+)
+
+
 food_research_prompt = """You are an expert culinary research specialist. Find exceptional dining experiences that showcase local cuisine and match the trip requirements and traveller preferences.
 
 TRIP CONTEXT:
-- Destination: {destination}, {destination_country}
-- Travel Dates: {date_from} to {date_to} ({days_number} days)
-- Group Type: {group_type}
-- Group Size: {adults_num} adults, {children_num} children, {infant_num} infants
-- Trip Purpose: {trip_purpose}
+""" + _TRIP_FACTS + """
 - Total Food Budget: {food_budget} {currency}
 
-traveller INFORMATION:
-{traveller_context}
+""" + _TRAVELLER_INFORMATION + """
 
-RESEARCH REQUIREMENTS:
-- Find exactly {candidates_number} dining options
-- Research Task: {research_name}
-- Specific Requirements: {research_description}
+""" + _research_requirements("dining options") + """
 
 DINING RESEARCH CRITERIA:
 
@@ -748,85 +975,7 @@ DINING RESEARCH CRITERIA:
 
 **EXAMPLES**:
 
-Example 1 - Family Dining (Tokyo):
-{{
-  "id": "12345",
-  "name": "Tonkatsu Wako",
-  "address": "1-2-1 Nihonbashi, Chuo City, Tokyo 103-0027",
-  "price_level": "$$",
-  "rating": 4.4,
-  "reviews": ["Great for families with children", "Authentic tonkatsu", "Friendly service and clean environment"],
-  "photos": ["https://example.com/tonkatsu1.jpg", "https://example.com/tonkatsu2.jpg"],
-  "url": "https://tripadvisor.com/restaurant/12345",
-  "lat": 35.6812,
-  "lon": 139.7671,
-  "open_time": "11:30",
-  "close_time": "21:30",
-  "tags": ["japanese", "family-friendly", "traditional", "tonkatsu"],
-  "evidence_score": 0.9,
-  "source_id": "tripadvisor",
-  "notes": "Child-friendly portions available, English menu available, accepts reservations"
-}}
-
-Example 2 - Romantic Dining (Paris):
-{{
-  "id": "67890",
-  "name": "Le Comptoir du Relais",
-  "address": "9 Carrefour de l'Odéon, 75006 Paris, France",
-  "price_level": "$$$",
-  "rating": 4.6,
-  "reviews": ["Perfect for romantic dinners", "Authentic French bistro", "Excellent wine selection"],
-  "photos": ["https://example.com/bistro1.jpg", "https://example.com/bistro2.jpg"],
-  "url": "https://tripadvisor.com/restaurant/67890",
-  "lat": 48.8534,
-  "lon": 2.3488,
-  "open_time": "12:00",
-  "close_time": "23:00",
-  "tags": ["french", "romantic", "bistro", "wine"],
-  "evidence_score": 0.95,
-  "source_id": "tripadvisor",
-  "notes": "Popular with locals, reservations recommended, romantic atmosphere in Saint-Germain"
-}}
-
-Example 3 - Solo traveller Street Food (Bangkok):
-{{
-  "id": "54321",
-  "name": "Jay Fai Street Food",
-  "address": "327 Maha Chai Rd, Samran Rat, Phra Nakhon, Bangkok 10200",
-  "price_level": "$",
-  "rating": 4.7,
-  "reviews": ["Amazing street food experience", "Famous crab omelet", "Worth the wait"],
-  "photos": ["https://example.com/street1.jpg", "https://example.com/street2.jpg"],
-  "url": "https://tripadvisor.com/restaurant/54321",
-  "lat": 13.7563,
-  "lon": 100.5018,
-  "open_time": "17:00",
-  "close_time": "02:00",
-  "tags": ["thai", "street-food", "local", "famous", "late-night"],
-  "evidence_score": 0.9,
-  "source_id": "tripadvisor",
-  "notes": "Michelin-starred street food, expect long queues, cash only, famous for crab omelet"
-}}
-
-Example 4 - Group Dining (New York):
-{{
-  "id": "98765",
-  "name": "Carmine's Italian Restaurant",
-  "address": "200 W 44th St, New York, NY 10036",
-  "price_level": "$$$",
-  "rating": 4.3,
-  "reviews": ["Perfect for large groups", "Family-style portions", "Great for celebrations"],
-  "photos": ["https://example.com/italian1.jpg", "https://example.com/italian2.jpg"],
-  "url": "https://tripadvisor.com/restaurant/98765",
-  "lat": 40.7589,
-  "lon": -73.9851,
-  "open_time": "11:30",
-  "close_time": "23:00",
-  "tags": ["italian", "group-friendly", "family-style", "theater-district"],
-  "evidence_score": 0.9,
-  "source_id": "tripadvisor",
-  "notes": "Family-style portions perfect for groups, near Broadway theaters, reservations recommended"
-}}
+""" + _format_examples(_FOOD_EXAMPLES) + """
 
 **STRICT OUTPUT FORMAT (MANDATORY)**:
 - Reply with exactly one JSON object shaped like this:
@@ -858,24 +1007,111 @@ Example 4 - Group Dining (New York):
 
 {additional_context}"""
 
+_INTERCITY_TRANSPORT_EXAMPLES = (
+    (
+        "Budget Solo traveller (Seoul to Tokyo)",
+        {
+            "name": "Economy Flight Seoul to Tokyo",
+            "fare_class": "Economy",
+            "refundable": False,
+            "url": "https://koreanair.com/flights/ICN-NRT",
+            "price": 280.0,
+            "transfer": [
+                {
+                    "name": "Korean Air KE001",
+                    "place": "Seoul ICN → Tokyo NRT",
+                    "departure_time": "14:30",
+                    "arrival_time": "17:45",
+                    "duration_min": 135
+                }
+            ],
+            "total_duration_min": 195,
+            "note": "Direct flight, includes 1 checked bag, meal service included"
+        },
+    ),
+    (
+        "Family Travel (Paris to Rome)",
+        {
+            "name": "Family Flight Paris to Rome with Connection",
+            "fare_class": "Economy",
+            "refundable": True,
+            "url": "https://airfrance.com/flights/CDG-FCO",
+            "price": 450.0,
+            "transfer": [
+                {
+                    "name": "Air France AF1504",
+                    "place": "Paris CDG → Munich MUC",
+                    "departure_time": "08:00",
+                    "arrival_time": "09:30",
+                    "duration_min": 90
+                },
+                {
+                    "name": "Lufthansa LH1840",
+                    "place": "Munich MUC → Rome FCO",
+                    "departure_time": "11:15",
+                    "arrival_time": "12:45",
+                    "duration_min": 90
+                }
+            ],
+            "total_duration_min": 285,
+            "note": "1-stop connection, family-friendly airline, includes 2 checked bags per person"
+        },
+    ),
+    (
+        "Business Travel (New York to London)",
+        {
+            "name": "Business Class New York to London",
+            "fare_class": "Business",
+            "refundable": True,
+            "url": "https://britishairways.com/flights/JFK-LHR",
+            "price": 1200.0,
+            "transfer": [
+                {
+                    "name": "British Airways BA114",
+                    "place": "New York JFK → London LHR",
+                    "departure_time": "22:30",
+                    "arrival_time": "10:00",
+                    "duration_min": 450
+                }
+            ],
+            "total_duration_min": 450,
+            "note": "Overnight flight, lie-flat seats, priority boarding, lounge access included"
+        },
+    ),
+    (
+        "Budget Group Travel (Bangkok to Singapore)",
+        {
+            "name": "Budget Bus Bangkok to Singapore",
+            "fare_class": "Standard",
+            "refundable": False,
+            "url": "https://busonlineticket.com/bangkok-singapore",
+            "price": 45.0,
+            "transfer": [
+                {
+                    "name": "VIP Bus Bangkok-Singapore",
+                    "place": "Bangkok Southern Bus Terminal → Singapore Golden Mile Complex",
+                    "departure_time": "20:00",
+                    "arrival_time": "06:00",
+                    "duration_min": 600
+                }
+            ],
+            "total_duration_min": 600,
+            "note": "Overnight bus, includes dinner and breakfast, border crossing assistance"
+        },
+    ),
+)
+
+
 intercity_transport_research_prompt = """You are an expert intercity transportation research specialist. Find the best transportation options between cities that match the trip requirements, budget, and traveller preferences.
 
 TRIP CONTEXT:
 - Origin: {current_location}
-- Destination: {destination}, {destination_country}
-- Travel Dates: {date_from} to {date_to} ({days_number} days)
-- Group Type: {group_type}
-- Group Size: {adults_num} adults, {children_num} children, {infant_num} infants
-- Trip Purpose: {trip_purpose}
+""" + _TRIP_FACTS + """
 - Total Transport Budget: {intercity_budget} {currency}
 
-traveller INFORMATION:
-{traveller_context}
+""" + _TRAVELLER_INFORMATION + """
 
-RESEARCH REQUIREMENTS:
-- Find exactly {candidates_number} transportation options
-- Research Task: {research_name}
-- Specific Requirements: {research_description}
+""" + _research_requirements("transportation options") + """
 
 TRANSPORTATION RESEARCH CRITERIA:
 
@@ -931,92 +1167,7 @@ Each transfer leg should include:
 
 **EXAMPLES**:
 
-Example 1 - Budget Solo traveller (Seoul to Tokyo):
-{{
-  "name": "Economy Flight Seoul to Tokyo",
-  "fare_class": "Economy",
-  "refundable": false,
-  "url": "https://koreanair.com/flights/ICN-NRT",
-  "price": 280.0,
-  "transfer": [
-    {{
-      "name": "Korean Air KE001",
-      "place": "Seoul ICN → Tokyo NRT",
-      "departure_time": "14:30",
-      "arrival_time": "17:45",
-      "duration_min": 135
-    }}
-  ],
-  "total_duration_min": 195,
-  "note": "Direct flight, includes 1 checked bag, meal service included"
-}}
-
-Example 2 - Family Travel (Paris to Rome):
-{{
-  "name": "Family Flight Paris to Rome with Connection",
-  "fare_class": "Economy",
-  "refundable": true,
-  "url": "https://airfrance.com/flights/CDG-FCO",
-  "price": 450.0,
-  "transfer": [
-    {{
-      "name": "Air France AF1504",
-      "place": "Paris CDG → Munich MUC",
-      "departure_time": "08:00",
-      "arrival_time": "09:30",
-      "duration_min": 90
-    }},
-    {{
-      "name": "Lufthansa LH1840",
-      "place": "Munich MUC → Rome FCO",
-      "departure_time": "11:15",
-      "arrival_time": "12:45",
-      "duration_min": 90
-    }}
-  ],
-  "total_duration_min": 285,
-  "note": "1-stop connection, family-friendly airline, includes 2 checked bags per person"
-}}
-
-Example 3 - Business Travel (New York to London):
-{{
-  "name": "Business Class New York to London",
-  "fare_class": "Business",
-  "refundable": true,
-  "url": "https://britishairways.com/flights/JFK-LHR",
-  "price": 1200.0,
-  "transfer": [
-    {{
-      "name": "British Airways BA114",
-      "place": "New York JFK → London LHR",
-      "departure_time": "22:30",
-      "arrival_time": "10:00+1",
-      "duration_min": 450
-    }}
-  ],
-  "total_duration_min": 450,
-  "note": "Overnight flight, lie-flat seats, priority boarding, lounge access included"
-}}
-
-Example 4 - Budget Group Travel (Bangkok to Singapore):
-{{
-  "name": "Budget Bus Bangkok to Singapore",
-  "fare_class": "Standard",
-  "refundable": false,
-  "url": "https://busonlineticket.com/bangkok-singapore",
-  "price": 45.0,
-  "transfer": [
-    {{
-      "name": "VIP Bus Bangkok-Singapore",
-      "place": "Bangkok Southern Bus Terminal → Singapore Golden Mile Complex",
-      "departure_time": "20:00",
-      "arrival_time": "06:00+1",
-      "duration_min": 600
-    }}
-  ],
-  "total_duration_min": 600,
-  "note": "Overnight bus, includes dinner and breakfast, border crossing assistance"
-}}
+""" + _format_examples(_INTERCITY_TRANSPORT_EXAMPLES) + """
 
 **STRICT OUTPUT FORMAT (MANDATORY)**:
 - Return a single JSON object in the exact structure below:
@@ -1048,17 +1199,175 @@ Example 4 - Budget Group Travel (Bangkok to Singapore):
 
 {additional_context}"""
 
+_RECOMMENDATIONS_EXAMPLES = (
+    (
+        "Family Travel to Japan",
+        {
+            "safety_level": "very_safe",
+            "safety_notes": [
+                "Japan is extremely safe for families with excellent infrastructure",
+                "Trains and public transport are very reliable and family-friendly",
+                "Clean drinking water and high food safety standards",
+                "Low crime rates, but keep valuables secure in crowded areas"
+            ],
+            "travel_advisories": [],
+            "visa_requirements": {
+                "US": "90-day visa-free entry",
+                "EU": "90-day visa-free entry",
+                "UK": "90-day visa-free entry"
+            },
+            "cultural_considerations": [
+                "Remove shoes when entering homes and some restaurants",
+                "Bow when greeting people",
+                "Be quiet on public transportation",
+                "Don't eat or drink while walking"
+            ],
+            "dress_code_recommendations": [
+                "Modest dress for temple visits",
+                "Business casual for upscale restaurants",
+                "Comfortable walking shoes for sightseeing"
+            ],
+            "local_customs": [
+                "Gift-giving is important in business and social situations",
+                "Pointing with index finger is considered rude",
+                "Slurping noodles shows appreciation for the food"
+            ],
+            "language_barriers": [
+                "English is not widely spoken outside tourist areas",
+                "Learn basic Japanese phrases for politeness",
+                "Use translation apps or phrasebooks",
+                "Many signs have English translations in major cities"
+            ],
+            "child_friendly_rating": 5,
+            "infant_considerations": [
+                "Excellent baby facilities in major train stations and department stores",
+                "Baby food and supplies widely available",
+                "Clean and safe environment for infants",
+                "Family rooms available in most accommodations"
+            ],
+            "elderly_accessibility": [
+                "Excellent accessibility in major cities",
+                "Elevators and ramps widely available",
+                "Senior-friendly public transportation",
+                "Many attractions have accessibility features"
+            ],
+            "weather_conditions": "Mild spring weather with cherry blossom season",
+            "seasonal_considerations": [
+                "Cherry blossom season brings crowds and higher prices",
+                "Pack layers for varying temperatures",
+                "Rain gear recommended for spring showers"
+            ],
+            "best_time_to_visit": "March-May for cherry blossoms, September-November for autumn colors",
+            "currency_info": "Japanese Yen (JPY), exchange rate approximately 150 JPY to 1 USD",
+            "payment_methods": [
+                "Cash is still widely used, carry sufficient cash",
+                "Credit cards accepted in major establishments",
+                "IC cards (Suica/Pasmo) for public transport and small purchases"
+            ],
+            "religious_restrictions": [
+                "Shinto and Buddhism are main religions",
+                "Temples and shrines require respectful behavior",
+                "No specific dress codes but modest attire preferred"
+            ],
+            "dietary_restrictions_support": {
+                "vegetarian": True,
+                "vegan": False,
+                "gluten_free": False,
+                "halal": False,
+                "kosher": False
+            }
+        },
+    ),
+    (
+        "Solo Travel to Thailand",
+        {
+            "safety_level": "safe",
+            "safety_notes": [
+                "Generally safe for solo travellers, especially in tourist areas",
+                "Be cautious with personal belongings in crowded places",
+                "Use reputable transportation and accommodation",
+                "Avoid political demonstrations and protests"
+            ],
+            "travel_advisories": [
+                "Exercise normal precautions in tourist areas",
+                "Avoid border areas with neighboring countries"
+            ],
+            "visa_requirements": {
+                "US": "30-day visa-free entry, extendable to 60 days",
+                "EU": "30-day visa-free entry",
+                "UK": "30-day visa-free entry"
+            },
+            "cultural_considerations": [
+                "Buddhist culture - respect religious sites",
+                "Don't point feet at people or religious objects",
+                "Remove shoes before entering temples",
+                "Dress modestly when visiting religious sites"
+            ],
+            "dress_code_recommendations": [
+                "Light, breathable clothing for hot weather",
+                "Modest dress for temple visits (covered shoulders and knees)",
+                "Comfortable sandals for walking"
+            ],
+            "local_customs": [
+                "Wai (prayer-like gesture) is traditional greeting",
+                "Don't touch people's heads",
+                "Use right hand for eating and giving/receiving items"
+            ],
+            "language_barriers": [
+                "English is spoken in tourist areas",
+                "Learn basic Thai phrases for politeness",
+                "Street signs often have English translations",
+                "Use translation apps for complex communication"
+            ],
+            "child_friendly_rating": 4,
+            "infant_considerations": [
+                "Family-friendly culture with children welcomed",
+                "Baby supplies available in major cities",
+                "Hot weather requires extra attention to hydration",
+                "Street food may not be suitable for infants"
+            ],
+            "elderly_accessibility": [
+                "Limited accessibility in older areas",
+                "Modern shopping centers have good accessibility",
+                "Tuk-tuks and taxis provide door-to-door service",
+                "Uneven sidewalks in older neighborhoods"
+            ],
+            "weather_conditions": "Hot and humid tropical climate with occasional rain",
+            "seasonal_considerations": [
+                "Rainy season from May to October",
+                "Cool season from November to February is most pleasant",
+                "Hot season from March to May can be very uncomfortable"
+            ],
+            "best_time_to_visit": "November to February for cooler, drier weather",
+            "currency_info": "Thai Baht (THB), exchange rate approximately 35 THB to 1 USD",
+            "payment_methods": [
+                "Cash preferred for small purchases and street food",
+                "Credit cards accepted in hotels and major restaurants",
+                "ATMs widely available but check fees"
+            ],
+            "religious_restrictions": [
+                "Buddhist majority country",
+                "Respect for monks and religious symbols required",
+                "Conservative dress in religious areas"
+            ],
+            "dietary_restrictions_support": {
+                "vegetarian": True,
+                "vegan": True,
+                "gluten_free": False,
+                "halal": True,
+                "kosher": False
+            }
+        },
+    ),
+)
+
+
 recommendations_research_prompt = """You are an expert travel advisor and cultural consultant. Provide comprehensive travel recommendations covering safety, cultural considerations, practical information, and local insights for the destination.
 
 TRIP CONTEXT:
-- Destination: {destination}, {destination_country}
-- Travel Dates: {date_from} to {date_to} ({days_number} days)
-- Group Type: {group_type}
-- Group Size: {adults_num} adults, {children_num} children, {infant_num} infants
-- Trip Purpose: {trip_purpose}
+""" + _TRIP_FACTS + """
 
-traveller INFORMATION:
-{traveller_context}
+""" + _TRAVELLER_INFORMATION + """
 
 RECOMMENDATIONS RESEARCH AREAS:
 
@@ -1117,162 +1426,7 @@ RECOMMENDATIONS RESEARCH AREAS:
 
 **EXAMPLES**:
 
-Example 1 - Family Travel to Japan:
-{{
-  "safety_level": "very_safe",
-  "safety_notes": [
-    "Japan is extremely safe for families with excellent infrastructure",
-    "Trains and public transport are very reliable and family-friendly",
-    "Clean drinking water and high food safety standards",
-    "Low crime rates, but keep valuables secure in crowded areas"
-  ],
-  "travel_advisories": [],
-  "visa_requirements": {{
-    "US": "90-day visa-free entry",
-    "EU": "90-day visa-free entry",
-    "UK": "90-day visa-free entry"
-  }},
-  "cultural_considerations": [
-    "Remove shoes when entering homes and some restaurants",
-    "Bow when greeting people",
-    "Be quiet on public transportation",
-    "Don't eat or drink while walking"
-  ],
-  "dress_code_recommendations": [
-    "Modest dress for temple visits",
-    "Business casual for upscale restaurants",
-    "Comfortable walking shoes for sightseeing"
-  ],
-  "local_customs": [
-    "Gift-giving is important in business and social situations",
-    "Pointing with index finger is considered rude",
-    "Slurping noodles shows appreciation for the food"
-  ],
-  "language_barriers": [
-    "English is not widely spoken outside tourist areas",
-    "Learn basic Japanese phrases for politeness",
-    "Use translation apps or phrasebooks",
-    "Many signs have English translations in major cities"
-  ],
-  "child_friendly_rating": 5,
-  "infant_considerations": [
-    "Excellent baby facilities in major train stations and department stores",
-    "Baby food and supplies widely available",
-    "Clean and safe environment for infants",
-    "Family rooms available in most accommodations"
-  ],
-  "elderly_accessibility": [
-    "Excellent accessibility in major cities",
-    "Elevators and ramps widely available",
-    "Senior-friendly public transportation",
-    "Many attractions have accessibility features"
-  ],
-  "weather_conditions": "Mild spring weather with cherry blossom season",
-  "seasonal_considerations": [
-    "Cherry blossom season brings crowds and higher prices",
-    "Pack layers for varying temperatures",
-    "Rain gear recommended for spring showers"
-  ],
-  "best_time_to_visit": "March-May for cherry blossoms, September-November for autumn colors",
-  "currency_info": "Japanese Yen (JPY), exchange rate approximately 150 JPY to 1 USD",
-  "payment_methods": [
-    "Cash is still widely used, carry sufficient cash",
-    "Credit cards accepted in major establishments",
-    "IC cards (Suica/Pasmo) for public transport and small purchases"
-  ],
-  "religious_restrictions": [
-    "Shinto and Buddhism are main religions",
-    "Temples and shrines require respectful behavior",
-    "No specific dress codes but modest attire preferred"
-  ],
-  "dietary_restrictions_support": {{
-    "vegetarian": true,
-    "vegan": false,
-    "gluten_free": false,
-    "halal": false,
-    "kosher": false
-  }}
-}}
-
-Example 2 - Solo Travel to Thailand:
-{{
-  "safety_level": "safe",
-  "safety_notes": [
-    "Generally safe for solo travellers, especially in tourist areas",
-    "Be cautious with personal belongings in crowded places",
-    "Use reputable transportation and accommodation",
-    "Avoid political demonstrations and protests"
-  ],
-  "travel_advisories": [
-    "Exercise normal precautions in tourist areas",
-    "Avoid border areas with neighboring countries"
-  ],
-  "visa_requirements": {{
-    "US": "30-day visa-free entry, extendable to 60 days",
-    "EU": "30-day visa-free entry",
-    "UK": "30-day visa-free entry"
-  }},
-  "cultural_considerations": [
-    "Buddhist culture - respect religious sites",
-    "Don't point feet at people or religious objects",
-    "Remove shoes before entering temples",
-    "Dress modestly when visiting religious sites"
-  ],
-  "dress_code_recommendations": [
-    "Light, breathable clothing for hot weather",
-    "Modest dress for temple visits (covered shoulders and knees)",
-    "Comfortable sandals for walking"
-  ],
-  "local_customs": [
-    "Wai (prayer-like gesture) is traditional greeting",
-    "Don't touch people's heads",
-    "Use right hand for eating and giving/receiving items"
-  ],
-  "language_barriers": [
-    "English is spoken in tourist areas",
-    "Learn basic Thai phrases for politeness",
-    "Street signs often have English translations",
-    "Use translation apps for complex communication"
-  ],
-  "child_friendly_rating": 4,
-  "infant_considerations": [
-    "Family-friendly culture with children welcomed",
-    "Baby supplies available in major cities",
-    "Hot weather requires extra attention to hydration",
-    "Street food may not be suitable for infants"
-  ],
-  "elderly_accessibility": [
-    "Limited accessibility in older areas",
-    "Modern shopping centers have good accessibility",
-    "Tuk-tuks and taxis provide door-to-door service",
-    "Uneven sidewalks in older neighborhoods"
-  ],
-  "weather_conditions": "Hot and humid tropical climate with occasional rain",
-  "seasonal_considerations": [
-    "Rainy season from May to October",
-    "Cool season from November to February is most pleasant",
-    "Hot season from March to May can be very uncomfortable"
-  ],
-  "best_time_to_visit": "November to February for cooler, drier weather",
-  "currency_info": "Thai Baht (THB), exchange rate approximately 35 THB to 1 USD",
-  "payment_methods": [
-    "Cash preferred for small purchases and street food",
-    "Credit cards accepted in hotels and major restaurants",
-    "ATMs widely available but check fees"
-  ],
-  "religious_restrictions": [
-    "Buddhist majority country",
-    "Respect for monks and religious symbols required",
-    "Conservative dress in religious areas"
-  ],
-  "dietary_restrictions_support": {{
-    "vegetarian": true,
-    "vegan": true,
-    "gluten_free": false,
-    "halal": true,
-    "kosher": false
-  }}
-}}
+""" + _format_examples(_RECOMMENDATIONS_EXAMPLES) + """
 
 **STRICT OUTPUT FORMAT (MANDATORY)**:
 - Output must be a single JSON object containing only the keys defined in the RecommendationsOutput schema, for example:
@@ -1312,15 +1466,10 @@ CRITICAL CONSTRAINT:
 - Your role is purely organizational and structural
 
 TRIP OVERVIEW:
-- Destination: {destination}, {destination_country}
-- Travel Dates: {date_from} to {date_to} ({days_number} days)
-- Group Type: {group_type}
-- Group Size: {adults_num} adults, {children_num} children, {infant_num} infants
-- Trip Purpose: {trip_purpose}
+""" + _TRIP_FACTS + """
 - Total Budget: {total_budget} {currency}
 
-traveller INFORMATION:
-{traveller_context}
+""" + _TRAVELLER_INFORMATION + """
 
 AVAILABLE RESEARCH RESULTS:
 {research_results_summary}
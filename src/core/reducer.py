@@ -1,4 +1,5 @@
-from typing import Optional, TypeVar
+from dataclasses import dataclass
+from typing import Generic, Optional, TypeVar, Union
 from pydantic import BaseModel
 import logging
 
@@ -6,14 +7,26 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar('T', bound=BaseModel)
 
-def reducer(existing: Optional[T], new: Optional[T]) -> Optional[T]:
+
+@dataclass(frozen=True)
+class Replace(Generic[T]):
+    """State update that overwrites the stored output instead of merging into it."""
+
+    value: Optional[T]
+
+
+def reducer(existing: Optional[T], new: Union[T, Replace[T], None]) -> Optional[T]:
     """Generic merge function for all agent output types."""
     
+    # Human review narrows the candidates, so its updates must not merge
+    if isinstance(new, Replace):
+        return new.value
+
     # Handle None cases
     if new is None:
         return existing
     if existing is None:
-        logger.info(f"Reducer: No existing items, using new items")
+        logger.info("Reducer: No existing items, using new items")
         return new
     
     # Get the type to work with
@@ -30,7 +43,7 @@ def reducer(existing: Optional[T], new: Optional[T]) -> Optional[T]:
     existing_items = getattr(existing, list_field_name, []) or []
     new_items = getattr(new, list_field_name, []) or []
     
-    logger.info(f"Reducer: Merging {list_field_name} - existing: {len(existing_items)}, new: {len(new_items)}")
+    logger.info("Reducer: Merging %s - existing: %d, new: %d", list_field_name, len(existing_items), len(new_items))
     
     # Build a set of existing IDs for deduplication
     existing_ids = {item.id for item in existing_items if hasattr(item, 'id') and item.id}
@@ -48,7 +61,7 @@ def reducer(existing: Optional[T], new: Optional[T]) -> Optional[T]:
             if item_id:
                 existing_ids.add(item_id)
     
-    logger.info(f"Reducer: Added {added_count} new items, total: {len(merged_items)}")
+    logger.info("Reducer: Added %d new items, total: %d", added_count, len(merged_items))
     
-    # Create and return new output instance with merged items
-    return output_type(**{list_field_name: merged_items})
+    # Both sides were validated when they entered the state, so skip re-validation
+    return output_type.model_construct(**{list_field_name: merged_items})
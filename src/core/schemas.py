@@ -15,13 +15,24 @@ Key model categories:
 """
 from __future__ import annotations
 
+import math
 from datetime import date
 from dataclasses import dataclass
-from typing import Annotated, Dict, List, Literal, Optional
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Annotated, Any, Dict, List, Literal, Mapping, Optional, Tuple, Type, TypeVar
 
 from langchain_core.messages import AnyMessage
 from langgraph.graph.message import add_messages
-from pydantic import BaseModel, ConfigDict, Field, computed_field, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    ValidationInfo,
+    computed_field,
+    field_validator,
+)
 
 from src.core.reducer import reducer
 from src.core.types import (
@@ -36,7 +47,35 @@ from src.core.types import (
 from langchain.agents import AgentExecutor
 
 
-class BudgetEstimate(BaseModel):
+@lru_cache(maxsize=None)
+def _cached_property_names(cls: type) -> Tuple[str, ...]:
+    """Names of every ``cached_property`` defined on ``cls`` or its bases."""
+    return tuple(
+        name
+        for klass in cls.__mro__
+        for name, attr in vars(klass).items()
+        if isinstance(attr, cached_property)
+    )
+
+
+class _CachedDerivedModel(BaseModel):
+    """Base for models that cache values derived from their fields.
+
+    ``cached_property`` stores results in the instance ``__dict__``, which
+    ``model_copy`` copies wholesale; copies drop those entries so they are
+    recomputed from the copy's own (possibly updated) fields.
+    """
+
+    model_config = ConfigDict(ignored_types=(cached_property,))
+
+    def model_copy(self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False):
+        copied = super().model_copy(update=update, deep=deep)
+        for name in _cached_property_names(type(self)):
+            copied.__dict__.pop(name, None)
+        return copied
+
+
+class BudgetEstimate(_CachedDerivedModel):
     """AI-generated budget breakdown covering all major travel cost categories.
     
     This model represents a comprehensive budget estimate created by the budget
@@ -70,20 +109,24 @@ class BudgetEstimate(BaseModel):
     budget_per_day: NonNegMoney = Field(description="Average daily budget")
     notes: Optional[str] = Field(default=None, description="Assumptions and rationale")
 
-    model_config = ConfigDict(extra="forbid")
+    # Frozen: ``total`` is cached, so in-place edits would leave it stale.
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
+    # Cached on first access; ``model_copy`` drops it so copies recompute it.
     @computed_field(return_type=float)
-    @property
+    @cached_property
     def total(self) -> float:
         """Return the total aggregated budget."""
 
-        return float(
-            self.intercity_transport
-            + self.local_transport
-            + self.food
-            + self.activities
-            + self.lodging
-            + self.other
+        return math.fsum(
+            (
+                self.intercity_transport,
+                self.local_transport,
+                self.food,
+                self.activities,
+                self.lodging,
+                self.other,
+            )
         )
 
 
@@ -143,7 +186,11 @@ class CandidateBase(BaseModel):
     source_id: Optional[str] = None
     notes: Optional[str] = None
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    def __hash__(self) -> int:
+        # List fields are unhashable, so hash the identifying fields only.
+        return hash((type(self), self.id, self.name, self.lat, self.lon))
 
 
 class CandidateLodging(CandidateBase):
@@ -166,7 +213,7 @@ class CandidateActivity(CandidateBase):
     close_time: Optional[TimeHHMM] = None
     duration_min: Optional[int] = Field(default=None, ge=0, le=12 * 60)
     price: Optional[NonNegMoney] = None
-    tags: List[str] = Field(default_factory=list)
+    tags: Tuple[str, ...] = ()
 
 
 class ActivitiesAgentOutput(BaseModel):
@@ -180,7 +227,7 @@ class CandidateFood(CandidateBase):
     """Food or dining option surfaced by the culinary research agent."""
     open_time: Optional[TimeHHMM] = None
     close_time: Optional[TimeHHMM] = None
-    tags: List[str] = Field(default_factory=list)
+    tags: Tuple[str, ...] = ()
 
 
 class FoodAgentOutput(BaseModel):
@@ -198,7 +245,7 @@ class Transfer(BaseModel):
     arrival_time: Optional[TimeHHMM] = None
     duration_min: Optional[int] = Field(default=None, ge=0, le=7 * 24 * 60)
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 
 class CandidateIntercityTransport(BaseModel):
@@ -208,11 +255,11 @@ class CandidateIntercityTransport(BaseModel):
     refundable: Optional[bool] = None
     url: Optional[HttpURLStr] = None
     price: Optional[NonNegMoney] = None
-    transfer: List[Transfer] = Field(default_factory=list)
+    transfer: Tuple[Transfer, ...] = ()
     total_duration_min: Optional[int] = Field(default=None, ge=0, le=7 * 24 * 60)
     note: Optional[str] = None
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 
 class IntercityTransportAgentOutput(BaseModel):
@@ -229,44 +276,46 @@ class IntracityHop(BaseModel):
     to_place: Optional[str] = None
     duration_min: Optional[int] = Field(default=None, ge=0, le=24 * 60)
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 
 class RecommendationsOutput(BaseModel):
     """Holistic travel advice spanning safety, cultural, and logistical tips."""
     safety_level: Optional[Literal["very_safe", "safe", "moderate", "risky", "dangerous"]] = None
-    safety_notes: Optional[List[str]] = Field(default_factory=list)
-    travel_advisories: Optional[List[str]] = Field(default_factory=list)
+    safety_notes: Optional[Tuple[str, ...]] = ()
+    travel_advisories: Optional[Tuple[str, ...]] = ()
     visa_requirements: Optional[Dict[str, str]] = Field(default_factory=dict)
-    cultural_considerations: Optional[List[str]] = Field(default_factory=list)
-    dress_code_recommendations: Optional[List[str]] = Field(default_factory=list)
-    local_customs: Optional[List[str]] = Field(default_factory=list)
-    language_barriers: Optional[List[str]] = Field(default_factory=list)
+    cultural_considerations: Optional[Tuple[str, ...]] = ()
+    dress_code_recommendations: Optional[Tuple[str, ...]] = ()
+    local_customs: Optional[Tuple[str, ...]] = ()
+    language_barriers: Optional[Tuple[str, ...]] = ()
     child_friendly_rating: Optional[int] = Field(default=None, ge=1, le=5)
-    infant_considerations: Optional[List[str]] = Field(default_factory=list)
-    elderly_accessibility: Optional[List[str]] = Field(default_factory=list)
+    infant_considerations: Optional[Tuple[str, ...]] = ()
+    elderly_accessibility: Optional[Tuple[str, ...]] = ()
     weather_conditions: Optional[str] = None
-    seasonal_considerations: Optional[List[str]] = Field(default_factory=list)
+    seasonal_considerations: Optional[Tuple[str, ...]] = ()
     best_time_to_visit: Optional[str] = None
     currency_info: Optional[str] = None
-    payment_methods: Optional[List[str]] = Field(default_factory=list)
-    religious_restrictions: Optional[List[str]] = Field(default_factory=list)
+    payment_methods: Optional[Tuple[str, ...]] = ()
+    religious_restrictions: Optional[Tuple[str, ...]] = ()
     dietary_restrictions_support: Optional[Dict[str, bool]] = Field(default_factory=dict)
 
+    model_config = ConfigDict(frozen=True)
+
 
 class PlanForDay(BaseModel):
     """Represents a single day in the itinerary with budget and activities."""
     day_number: int = Field(ge=1)
     day_date: date
-    activities: List[CandidateActivity] = Field(default_factory=list)
-    food: List[CandidateFood] = Field(default_factory=list)
-    intracity_moves: List[IntracityHop] = Field(default_factory=list)
+    activities: Tuple[CandidateActivity, ...] = ()
+    food: Tuple[CandidateFood, ...] = ()
+    intracity_moves: Tuple[IntracityHop, ...] = ()
     day_budget: NonNegMoney
     start_time: Optional[TimeHHMM] = None
     end_time: Optional[TimeHHMM] = None
     notes: Optional[str] = None
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 class FinalPlan(BaseModel):
     """Completed itinerary or a follow-up research request from the planner."""
@@ -317,7 +366,19 @@ class State(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
 
-class Traveller(BaseModel):
+def _age_group_on(date_of_birth: date, today: date) -> Literal["infant", "child", "adult"]:
+    """Classify a date of birth relative to ``today``."""
+    age = today.year - date_of_birth.year - (
+        (today.month, today.day) < (date_of_birth.month, date_of_birth.day)
+    )
+    if age < 2:
+        return "infant"
+    if age < 18:
+        return "child"
+    return "adult"
+
+
+class Traveller(_CachedDerivedModel):
     """Minimal traveller profile used to evaluate budgets and preferences."""
     name: str
     date_of_birth: date
@@ -326,23 +387,51 @@ class Traveller(BaseModel):
     nationality: Optional[str] = None
     notes: Optional[str] = None
 
-    model_config = ConfigDict(extra="forbid")
+    # Frozen: Context caches values derived from its travellers.
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     @computed_field(return_type=str)
-    @property
+    @cached_property
     def age_group(self) -> Literal["infant", "child", "adult"]:
-        today = date.today()
-        age = today.year - self.date_of_birth.year - (
-            (today.month, today.day) < (self.date_of_birth.month, self.date_of_birth.day)
+        return _age_group_on(self.date_of_birth, date.today())
+
+
+@lru_cache(maxsize=512)
+def _traveller_line(
+    name: str,
+    age_group: str,
+    interests: Tuple[str, ...],
+    nationality: Optional[str],
+    spoken_languages: Tuple[str, ...],
+) -> str:
+    """Format one traveller's prompt line; keyed on hashable field values."""
+    context_parts = [name, f"age: {age_group}"]
+
+    if interests:
+        context_parts.append(f"interests: {', '.join(interests)}")
+    if nationality:
+        context_parts.append(f"nationality: {nationality}")
+    if spoken_languages:
+        context_parts.append(f"languages: {', '.join(spoken_languages)}")
+
+    return f"- {' | '.join(context_parts)}\n"
+
+
+def make_traveller_context(travellers: List[Traveller]) -> str:
+    """Make the traveller context for the prompt."""
+    return "".join(
+        _traveller_line(
+            traveller.name,
+            traveller.age_group,
+            tuple(traveller.interests or ()),
+            traveller.nationality,
+            tuple(traveller.spoken_languages or ()),
         )
-        if age < 2:
-            return "infant"
-        if age < 18:
-            return "child"
-        return "adult"
+        for traveller in travellers or ()
+    )
 
 
-class Context(BaseModel):
+class Context(_CachedDerivedModel):
     """Immutable configuration describing the trip being planned."""
     travellers: List[Traveller] = Field(default_factory=list)
     budget: NonNegMoney = Field(default=1000)
@@ -356,33 +445,91 @@ class Context(BaseModel):
     trip_purpose: Optional[str] = None
     notes: Optional[str] = None
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
-    @model_validator(mode="after")
-    def validate_dates(self) -> "Context":
-        if self.date_from > self.date_to:
+    @field_validator("date_to")
+    @classmethod
+    def validate_dates(cls, date_to: date, info: ValidationInfo) -> date:
+        date_from = info.data.get("date_from")
+        if date_from is not None and date_from > date_to:
             raise ValueError("date_from must be before or equal to date_to")
-        return self
+        return date_to
+
+    @cached_property
+    def _age_counts(self) -> Dict[str, int]:
+        """Count travellers per age group in a single pass over the list."""
+        counts = {"adult": 0, "child": 0, "infant": 0}
+        for traveller in self.travellers:
+            counts[traveller.age_group] += 1
+        return counts
 
     @computed_field(return_type=int)
-    @property
+    @cached_property
     def days_number(self) -> int:
         return (self.date_to - self.date_from).days + 1
 
     @computed_field(return_type=int)
-    @property
+    @cached_property
     def adults_num(self) -> int:
-        return sum(1 for traveller in self.travellers if traveller.age_group == "adult")
+        return self._age_counts["adult"]
 
     @computed_field(return_type=int)
-    @property
+    @cached_property
     def children_num(self) -> int:
-        return sum(1 for traveller in self.travellers if traveller.age_group == "child")
+        return self._age_counts["child"]
 
     @computed_field(return_type=int)
-    @property
+    @cached_property
     def infant_num(self) -> int:
-        return sum(1 for traveller in self.travellers if traveller.age_group == "infant")
+        return self._age_counts["infant"]
+
+    @cached_property
+    def _prompt_field_values(self) -> Dict[str, Any]:
+        """Build the shared prompt fields once; a plain dict stays picklable."""
+        return {
+            "destination": self.destination,
+            "destination_country": self.destination_country,
+            "date_from": self.date_from,
+            "date_to": self.date_to,
+            "days_number": self.days_number,
+            "group_type": self.group_type,
+            "adults_num": self.adults_num or 0,
+            "children_num": self.children_num or 0,
+            "infant_num": self.infant_num or 0,
+            "trip_purpose": self.trip_purpose or 'General travel',
+            "currency": self.currency,
+            "traveller_context": make_traveller_context(self.travellers),
+            "additional_context": f"ADDITIONAL CONTEXT: {self.notes}" if self.notes else "",
+        }
+
+    @property
+    def prompt_fields(self) -> Mapping[str, Any]:
+        """Prompt fields shared by every node; ``str.format`` ignores unused keys."""
+        return MappingProxyType(self._prompt_field_values)
+
+
+OutputT = TypeVar("OutputT", bound=BaseModel)
+
+
+def fast_wrap(cls: Type[OutputT], **fields: Any) -> OutputT:
+    """Build an agent-output envelope around already-validated candidates.
+
+    Uses ``model_construct`` and therefore skips validation entirely: callers
+    must only pass model instances that have been validated upstream (agent
+    structured output, the list adapters below, or an existing state value).
+    LLM- and API-facing entry points keep going through the full validator.
+    """
+    return cls.model_construct(**fields)
+
+
+# Compiled once so whole candidate lists cross the pydantic-core boundary in a
+# single call instead of one model construction per item.
+CANDIDATE_LIST_ADAPTERS: Dict[str, TypeAdapter] = {
+    "lodging": TypeAdapter(List[CandidateLodging]),
+    "activities": TypeAdapter(List[CandidateActivity]),
+    "food": TypeAdapter(List[CandidateFood]),
+    "intercity_transport": TypeAdapter(List[CandidateIntercityTransport]),
+}
 
 
 @dataclass(slots=True)
@@ -418,4 +565,6 @@ __all__ = [
     "Traveller",
     "Context",
     "ResearchAgents",
+    "CANDIDATE_LIST_ADAPTERS",
+    "fast_wrap",
 ]
@@ -1,12 +1,17 @@
 """Small helpers for using the public Nominatim geocoding service."""
 from __future__ import annotations
 
+from collections import OrderedDict
 from typing import Optional
 
 import requests
 import httpx
 import asyncio
 
+# Successful lookups only; coordinates for a place name do not change.
+_CACHE_MAXSIZE = 4096
+_coordinates_cache: "OrderedDict[str, str]" = OrderedDict()
+
 
 async def get_coordinates_nominatim(
     location: str,
@@ -19,6 +24,11 @@ async def get_coordinates_nominatim(
     if not location:
         return None
 
+    cached = _coordinates_cache.get(location)
+    if cached is not None:
+        _coordinates_cache.move_to_end(location)
+        return cached
+
     try:
         async with httpx.AsyncClient(timeout=timeout, headers={"User-Agent": user_agent}) as client:
             response = await client.get(
@@ -34,4 +44,8 @@ async def get_coordinates_nominatim(
         return None
 
     first = data[0]
-    return f"{first['lat']},{first['lon']}"
\ No newline at end of file
+    coordinates = f"{first['lat']},{first['lon']}"
+    _coordinates_cache[location] = coordinates
+    if len(_coordinates_cache) > _CACHE_MAXSIZE:
+        _coordinates_cache.popitem(last=False)
+    return coordinates
\ No newline at end of file
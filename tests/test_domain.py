@@ -1,6 +1,8 @@
 """Tests for domain models and data validation."""
 from __future__ import annotations
 
+import copy
+import pickle
 from datetime import date
 
 import pytest
@@ -17,6 +19,7 @@ from src.core.schemas import (
     FinalPlan,
     ResearchPlan,
     State,
+    Traveller,
 )
 
 
@@ -38,6 +41,26 @@ def test_budget_estimate_creation():
     assert budget.budget_level == "$$"
 
 
+def test_budget_estimate_copy_recomputes_total():
+    budget = BudgetEstimate(
+        currency="USD",
+        intercity_transport=100,
+        local_transport=100,
+        food=100,
+        activities=100,
+        lodging=100,
+        budget_per_day=100,
+    )
+    assert budget.total == 500.0
+
+    copied = budget.model_copy(update={"food": 300})
+
+    assert copied.total == 700.0
+    assert budget.total == 500.0
+    with pytest.raises(ValidationError):
+        budget.food = 300
+
+
 def test_budget_estimate_missing_required_fields():
     """Test that missing required fields raise validation errors."""
     with pytest.raises(ValidationError):
@@ -77,6 +100,83 @@ def test_context_invalid_dates():
         )
 
 
+def test_context_copy_recomputes_derived_values():
+    today = date.today()
+    context = Context(
+        travellers=[Traveller(name="Ann", date_of_birth=date(1990, 1, 1))],
+        current_location="Seoul",
+        destination="Tokyo",
+        destination_country="Japan",
+        date_from=date(2030, 1, 1),
+        date_to=date(2030, 1, 3),
+        group_type="alone",
+    )
+    assert (context.days_number, context.adults_num, context.children_num) == (3, 1, 0)
+
+    copied = context.model_copy(
+        update={
+            "date_to": date(2030, 1, 10),
+            "travellers": [
+                *context.travellers,
+                Traveller(name="Kid", date_of_birth=date(today.year - 10, 1, 1)),
+            ],
+        }
+    )
+
+    assert (copied.days_number, copied.adults_num, copied.children_num) == (10, 1, 1)
+    assert context.days_number == 3
+
+
+def test_context_copy_recomputes_prompt_fields():
+    context = Context(
+        current_location="Seoul",
+        destination="Tokyo",
+        destination_country="Japan",
+        date_from=date(2030, 1, 1),
+        date_to=date(2030, 1, 3),
+        group_type="alone",
+    )
+    assert context.prompt_fields["destination"] == "Tokyo"
+
+    copied = context.model_copy(update={"destination": "Osaka", "notes": "Vegan"})
+
+    assert copied.prompt_fields["destination"] == "Osaka"
+    assert copied.prompt_fields["additional_context"] == "ADDITIONAL CONTEXT: Vegan"
+    assert context.prompt_fields["destination"] == "Tokyo"
+
+
+def test_context_with_cached_prompt_fields_copies_and_pickles():
+    context = Context(
+        current_location="Seoul",
+        destination="Tokyo",
+        destination_country="Japan",
+        date_from=date(2030, 1, 1),
+        date_to=date(2030, 1, 3),
+        group_type="alone",
+    )
+    assert context.prompt_fields["days_number"] == 3
+
+    for clone in (
+        context.model_copy(deep=True),
+        copy.deepcopy(context),
+        pickle.loads(pickle.dumps(context)),
+    ):
+        assert clone.prompt_fields == context.prompt_fields
+    with pytest.raises(TypeError):
+        context.prompt_fields["destination"] = "Osaka"
+
+
+def test_traveller_age_group_is_derived():
+    """age_group is computed from date_of_birth and is not accepted as input."""
+    date_of_birth = date(date.today().year - 10, 1, 1)
+    child = Traveller(name="Kid", date_of_birth=date_of_birth)
+
+    assert child.age_group == "child"
+    assert child.model_dump()["age_group"] == "child"
+    with pytest.raises(ValidationError):
+        Traveller(name="Kid", date_of_birth=date_of_birth, age_group="adult")
+
+
 def test_research_plan_creation():
     """Test creating a valid research plan."""
     plan = ResearchPlan(
@@ -125,6 +225,16 @@ def test_candidate_models():
     assert transport.total_duration_min == 150
 
 
+def test_candidates_are_frozen_and_hashable():
+    """Candidates are read-only once produced and can be de-duplicated."""
+    food = CandidateFood(name="Ramen House", tags=["noodles"])
+    with pytest.raises(ValidationError):
+        food.name = "Udon House"
+
+    duplicate = CandidateFood(name="Ramen House", tags=["noodles"])
+    assert len({food, duplicate}) == 1
+
+
 def test_final_plan_creation():
     """Test creating a final plan."""
     lodging = CandidateLodging(name="Hotel Aurora", price_night=150)
@@ -165,3 +165,31 @@ def test_convert_returns_parsed_output():
 
     assert isinstance(result, FoodAgentOutput)
     assert result.food[0].name == "Cafe 21"
+
+
+@pytest.mark.parametrize(
+    "raw_output",
+    [
+        '{"lodging": [{"name": "Lakeside Hotel"}]}',
+        'Here you go:\n```json\n{"lodging": [{"name": "Lakeside Hotel"}]}\n```',
+        'Sure! {"lodging": [{"name": "Lakeside Hotel"}]} Let me know.',
+    ],
+)
+def test_extract_json_tolerates_wrappers(raw_output):
+    hook = create_pydantic_hook("lodging")
+
+    assert hook._extract_json_from_output(raw_output) == {"lodging": [{"name": "Lakeside Hotel"}]}
+
+
+def test_on_chain_end_accepts_transport_alias_inside_fence():
+    hook = create_pydantic_hook("intercity_transport")
+    raw_payload = json.dumps(
+        {"transport": [{"name": "Night Bus", "transfer": [{"name": "Terminal 1", "place": "Osaka"}]}]}
+    )
+
+    outputs = {"structured_response": None}
+    result = hook.on_chain_end(outputs, raw_output=f"```json\n{raw_payload}\n```")
+
+    assert isinstance(result, IntercityTransportAgentOutput)
+    assert [item.name for item in result.intercity_transport] == ["Night Bus"]
+    assert result.intercity_transport[0].transfer[0].place == "Osaka"
@@ -0,0 +1,74 @@
+"""Keep the prompt templates in step with the models they describe."""
+from __future__ import annotations
+
+import json
+import re
+import textwrap
+
+import pytest
+
+from src.core import prompts
+from src.core.schemas import (
+    BudgetEstimate,
+    CandidateActivity,
+    CandidateFood,
+    CandidateIntercityTransport,
+    CandidateLodging,
+    RecommendationsOutput,
+    ResearchPlan,
+)
+
+_TEMPLATES = {
+    name: value for name, value in vars(prompts).items() if name.endswith("_prompt") and isinstance(value, str)
+}
+
+_OUTPUT_FORMAT = re.compile(r"STRICT OUTPUT FORMAT \(MANDATORY\)\*\*:\n- [^\n]*\n(\{\{\n.*?\n\}\})\n", re.DOTALL)
+
+
+@pytest.mark.parametrize(
+    "examples, model",
+    [
+        (prompts._BUDGET_EXAMPLES, BudgetEstimate),
+        (prompts._RESEARCH_PLAN_EXAMPLES, ResearchPlan),
+        (prompts._LODGING_EXAMPLES, CandidateLodging),
+        (prompts._ACTIVITIES_EXAMPLES, CandidateActivity),
+        (prompts._FOOD_EXAMPLES, CandidateFood),
+        (prompts._INTERCITY_TRANSPORT_EXAMPLES, CandidateIntercityTransport),
+        (prompts._RECOMMENDATIONS_EXAMPLES, RecommendationsOutput),
+    ],
+    ids=["budget", "research_plan", "lodging", "activities", "food", "intercity_transport", "recommendations"],
+)
+def test_prompt_examples_validate_against_models(examples, model):
+    for _, payload in examples:
+        model.model_validate(payload)
+
+
+@pytest.mark.parametrize(
+    "template, collection, model",
+    [
+        (prompts.lodging_research_prompt, "lodging", CandidateLodging),
+        (prompts.activities_research_prompt, "activities", CandidateActivity),
+        (prompts.food_research_prompt, "food", CandidateFood),
+        (prompts.intercity_transport_research_prompt, "intercity_transport", CandidateIntercityTransport),
+        (prompts.recommendations_research_prompt, None, RecommendationsOutput),
+    ],
+    ids=["lodging", "activities", "food", "intercity_transport", "recommendations"],
+)
+def test_strict_output_format_lists_model_fields(template, collection, model):
+    match = _OUTPUT_FORMAT.search(template)
+    assert match is not None
+
+    skeleton = json.loads(match.group(1).replace("{{", "{").replace("}}", "}"))
+    if collection is not None:
+        assert list(skeleton) == [collection]
+        skeleton = skeleton[collection][0]
+
+    assert set(skeleton) == set(model.model_fields)
+
+
+@pytest.mark.parametrize("name", sorted(_TEMPLATES))
+def test_templates_need_no_render_time_dedent(name):
+    template = _TEMPLATES[name]
+
+    assert template == template.strip()
+    assert textwrap.dedent(template) == template
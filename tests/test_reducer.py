@@ -14,7 +14,7 @@ from src.core.schemas import (
     LodgingAgentOutput,
     State
 )
-from src.core.reducer import reducer
+from src.core.reducer import Replace, reducer
 from langchain_core.messages import HumanMessage
 
 
@@ -134,3 +134,15 @@ class TestReducer:
             ])
         )
         assert len(transport_result.intercity_transport) == 2
+
+    def test_replace_overwrites_existing_items(self):
+        """Test that a Replace update overwrites instead of merging."""
+        existing = LodgingAgentOutput(lodging=[
+            CandidateLodging(name="Hotel A"),
+            CandidateLodging(name="Hotel B"),
+        ])
+        selected = LodgingAgentOutput(lodging=[CandidateLodging(name="Hotel B")])
+
+        result = reducer(existing, Replace(selected))
+
+        assert result is selected
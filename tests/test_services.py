@@ -83,6 +83,27 @@ async def test_get_coordinates_nominatim_invalid_input(mock_get):
     assert result is None
 
 
+@pytest.mark.asyncio
+async def test_get_coordinates_nominatim_caches_successful_lookups():
+    """Repeated lookups for the same place reuse the first response."""
+    from src.services.geocoding import geocoding
+
+    geocoding._coordinates_cache.clear()
+    mock_response = Mock()
+    mock_response.json.return_value = [{"lat": "48.8566", "lon": "2.3522"}]
+    mock_response.raise_for_status.return_value = None
+    mock_client = AsyncMock()
+    mock_client.get.return_value = mock_response
+    mock_client.__aenter__.return_value = mock_client
+
+    with patch.object(geocoding.httpx, "AsyncClient", return_value=mock_client):
+        assert await get_coordinates_nominatim("Paris, France") == "48.8566,2.3522"
+        assert await get_coordinates_nominatim("Paris, France") == "48.8566,2.3522"
+
+    mock_client.get.assert_called_once()
+    geocoding._coordinates_cache.clear()
+
+
 # TripAdvisor Tests
 class TestTripAdvisor:
     """Test suite for the TripAdvisor client."""
@@ -1,11 +1,15 @@
 """Unit tests for the trip planner workflow (nodes + compiled graph)."""
 from __future__ import annotations
 
+import asyncio
+import inspect
+import json
 from datetime import date
 from typing import Any, Dict, List, Tuple, Type
 
 import pytest
 from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.graph import END, START, StateGraph
 from langgraph.graph.state import CompiledStateGraph
 from langgraph.runtime import Runtime
 from langgraph.types import Command
@@ -27,8 +31,9 @@ from src.core.schemas import (
     State,
     ResearchAgents
 )
-from src.core.nodes import make_budget_estimate_node, make_research_plan_node, make_lodging_node, make_activities_node, make_food_node, make_intercity_transport_node, make_recommendations_node, make_planner_node, make_combined_human_review_node, route_from_human_response
+from src.core.nodes import make_budget_estimate_node, make_research_plan_node, make_lodging_node, make_activities_node, make_food_node, make_intercity_transport_node, make_recommendations_node, make_planner_node, make_combined_human_review_node, route_from_human_response, make_research, _empty_lodging, _limited
 from src.core.builders import build_research_graph
+from src.core.reducer import reducer
 from src.core.schemas import BudgetEstimate
 # ---------------------------------------------------------------------------
 # Test doubles
@@ -213,15 +218,111 @@ async def test_combined_human_review_node_resume_returns_models(sample_context,
     node = make_combined_human_review_node()
     result = await node(state, runtime)
 
-    assert isinstance(result["lodging"], LodgingAgentOutput)
-    assert isinstance(result["activities"], ActivitiesAgentOutput)
-    assert isinstance(result["food"], FoodAgentOutput)
-    assert isinstance(result["intercity_transport"], IntercityTransportAgentOutput)
+    assert isinstance(result["lodging"].value, LodgingAgentOutput)
+    assert isinstance(result["activities"].value, ActivitiesAgentOutput)
+    assert isinstance(result["food"].value, FoodAgentOutput)
+    assert isinstance(result["intercity_transport"].value, IntercityTransportAgentOutput)
     assert isinstance(result["research_plan"], ResearchPlan)
-    assert result["lodging"].lodging[0].name == "Hotel Aurora"
+    assert result["lodging"].value.lodging[0].name == "Hotel Aurora"
     assert result["messages"][0].content == "Human review completed"
 
 
+@pytest.mark.asyncio
+async def test_combined_human_review_node_reuses_unchanged_selection(monkeypatch):
+    lodging = LodgingAgentOutput(lodging=[CandidateLodging(name="Hotel Aurora")])
+    state = State(messages=[], lodging=lodging)
+    runtime = Runtime(context=None)  # the review node never reads the context
+
+    def fake_interrupt(payload):
+        return {"lodging": payload["selections"][0]["options"]}
+
+    monkeypatch.setattr("src.core.nodes.interrupt", fake_interrupt)
+
+    node = make_combined_human_review_node()
+    result = await node(state, runtime)
+
+    # No update: the reducer would merge state with itself and duplicate it
+    assert "lodging" not in result
+
+
+@pytest.mark.asyncio
+async def test_combined_human_review_node_matches_json_selection(monkeypatch):
+    activities = ActivitiesAgentOutput(
+        activities=[CandidateActivity(name="Sushi Workshop", tags=("food", "class"))]
+    )
+    state = State(messages=[], activities=activities)
+
+    def fake_interrupt(payload):
+        # Round-trip through JSON as an API client would: tuples become lists
+        return {"activities": json.loads(json.dumps(payload["selections"][0]["options"]))}
+
+    monkeypatch.setattr("src.core.nodes.interrupt", fake_interrupt)
+    monkeypatch.setattr("src.core.nodes._validate_selection", None)  # must not be reached
+
+    node = make_combined_human_review_node()
+    result = await node(state, Runtime(context=None))
+
+    assert "activities" not in result
+
+
+@pytest.mark.asyncio
+async def test_combined_human_review_node_caps_options(monkeypatch):
+    food = FoodAgentOutput(food=[CandidateFood(name=f"Place {i}") for i in range(5)])
+    state = State(messages=[], food=food)
+    captured: Dict[str, Any] = {}
+
+    def fake_interrupt(payload):
+        captured.update(payload)
+        return {}
+
+    monkeypatch.setattr("src.core.nodes.interrupt", fake_interrupt)
+    monkeypatch.setattr("src.core.nodes.MAX_REVIEW_OPTIONS", 3)
+
+    node = make_combined_human_review_node()
+    await node(state, Runtime(context=None))
+
+    options = captured["selections"][0]["options"]
+    assert [option["name"] for option in options] == ["Place 0", "Place 1", "Place 2"]
+
+
+@pytest.mark.asyncio
+async def test_combined_human_review_node_drops_options_past_cap(monkeypatch):
+    food = FoodAgentOutput(food=[CandidateFood(name=f"Place {i}") for i in range(5)])
+    state = State(messages=[], food=food)
+
+    def fake_interrupt(payload):
+        # Keep every option that was shown
+        return {"food": payload["selections"][0]["options"]}
+
+    monkeypatch.setattr("src.core.nodes.interrupt", fake_interrupt)
+    monkeypatch.setattr("src.core.nodes.MAX_REVIEW_OPTIONS", 3)
+
+    graph = StateGraph(State)
+    graph.add_node("review", make_combined_human_review_node())
+    graph.add_edge(START, "review")
+    graph.add_edge("review", END)
+    final_state = await graph.compile().ainvoke(state)
+
+    # Checked after the State reducer, which would otherwise merge all 5 back
+    assert [item.name for item in final_state["food"].food] == ["Place 0", "Place 1", "Place 2"]
+
+
+@pytest.mark.asyncio
+async def test_combined_human_review_node_replaces_state_with_selection(monkeypatch):
+    food = FoodAgentOutput(food=[CandidateFood(name=f"Place {i}") for i in range(3)])
+    state = State(messages=[], food=food)
+
+    def fake_interrupt(payload):
+        return {"food": payload["selections"][0]["options"][1]}
+
+    monkeypatch.setattr("src.core.nodes.interrupt", fake_interrupt)
+
+    node = make_combined_human_review_node()
+    result = await node(state, Runtime(context=None))
+
+    assert [item.name for item in reducer(state.food, result["food"]).food] == ["Place 1"]
+
+
 @pytest.mark.asyncio
 async def test_budget_estimate_node_returns_estimate(base_state, sample_context, stub_components):
     llm, _ = stub_components
@@ -369,6 +470,39 @@ def test_build_research_graph_creates_compiled_graph(stub_components):
     assert isinstance(graph, CompiledStateGraph)
 
 
+def test_build_research_graph_reuses_compiled_graph():
+    llm = StubLLM()
+    for model_cls in (BudgetEstimate, ResearchPlan, FinalPlan):
+        llm.set_response(model_cls, None)
+    agents = ResearchAgents(
+        lodging=DummyAgent(None),
+        activities=DummyAgent(None),
+        food=DummyAgent(None),
+        intercity_transport=DummyAgent(None),
+        recommendations=DummyAgent(None),
+    )
+
+    first = build_research_graph(llm=llm, agents=agents, human_review="auto")
+    assert build_research_graph(llm=llm, agents=agents, human_review="auto") is first
+    assert build_research_graph(llm=llm, agents=agents, human_review="interrupt") is not first
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [
+        make_lodging_node,
+        make_activities_node,
+        make_food_node,
+        make_intercity_transport_node,
+        make_recommendations_node,
+    ],
+)
+def test_research_nodes_are_coroutines(factory):
+    # LangGraph awaits async nodes of one superstep together; a sync node here
+    # would serialise the research fan-out behind blocking agent calls.
+    assert inspect.iscoroutinefunction(factory(DummyAgent(None)))
+
+
 # ---------------------------------------------------------------------------
 # Compiled graph integration tests
 # ---------------------------------------------------------------------------
@@ -426,3 +560,26 @@ async def test_compiled_graph_interrupt_resume(sample_context, stub_components):
     assert isinstance(resumed["intercity_transport"], IntercityTransportAgentOutput)
     assert resumed["intercity_transport"].intercity_transport[0].name == "Bullet Train"
 
+
+
+def test_limited_runs_on_successive_event_loops():
+    # The concurrency slot is created per running loop, so separate
+    # asyncio.run calls (one per planning request) don't share a semaphore.
+    async def call() -> str:
+        return "ok"
+
+    assert asyncio.run(_limited(call)) == "ok"
+    assert asyncio.run(_limited(call)) == "ok"
+
+
+@pytest.mark.asyncio
+async def test_make_research_builds_a_fresh_fallback_per_failure():
+    class FailingAgent:
+        async def ainvoke(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+            raise RuntimeError("agent down")
+
+    first = await make_research("Find hotels", FailingAgent(), "lodging", _empty_lodging)
+    second = await make_research("Find hotels", FailingAgent(), "lodging", _empty_lodging)
+
+    assert first["lodging"] == LodgingAgentOutput(lodging=[])
+    assert first["lodging"] is not second["lodging"]